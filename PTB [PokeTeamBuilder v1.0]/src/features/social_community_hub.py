@@ -4,6 +4,7 @@ Comprehensive social system with friends, leaderboards, tournaments,
 team sharing, battle replays, and community-driven content.
 """
 
+import atexit
 import json
 import sqlite3
 import hashlib
@@ -170,15 +171,31 @@ class Leaderboard:
 class SocialDatabase:
     """Database manager for social features."""
     
+    # Counters kept in the system_stats table by triggers:
+    # name -> (table, column whose updates affect it, row condition)
+    STAT_COUNTERS = {
+        'total_users': ('users', None, None),
+        'verified_users': ('users', 'email_verified', "{row}.email_verified = 1"),
+        'online_users': ('users', 'status', "{row}.status = 'online'"),
+        'total_posts': ('community_posts', None, None),
+        'shared_teams': ('team_shares', None, None),
+        'battle_replays': ('battle_replays', None, None),
+        'total_friendships': ('friendships', None, None),
+        'active_friendships': ('friendships', 'status', "{row}.status = 'accepted'"),
+    }
+    
     def __init__(self, db_path: str = "social_features.db"):
         self.db_path = db_path
         self.connection = None
         self._initialize_database()
+        
+        # Make sure PRAGMA optimize runs and the WAL is checkpointed on exit
+        # even if no owner closes the database explicitly
+        atexit.register(self.close)
     
     def _initialize_database(self):
         """Initialize the social features database."""
-        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.connection.row_factory = sqlite3.Row
+        self.connection = self.new_connection()
         
         # Create tables
         self._create_tables()
@@ -186,6 +203,40 @@ class SocialDatabase:
         # Insert sample data
         self._insert_sample_data()
     
+    def new_connection(self, **connect_kwargs) -> sqlite3.Connection:
+        """Open a tuned connection to the database (one per thread)."""
+        connection = sqlite3.connect(self.db_path, check_same_thread=False, **connect_kwargs)
+        connection.row_factory = sqlite3.Row
+        self._apply_pragmas(connection)
+        return connection
+    
+    @staticmethod
+    def _apply_pragmas(connection: sqlite3.Connection):
+        """Tune a connection for the read-heavy GUI/admin workload."""
+        cursor = connection.cursor()
+        # Must precede the WAL switch; only takes effect for new database
+        # files (existing ones pick it up on their next full VACUUM)
+        cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB mmap window
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    
+    def close(self):
+        """Refresh query planner statistics and close the connection."""
+        if self.connection is None:
+            return
+        
+        try:
+            self.connection.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+        
+        self.connection.close()
+        self.connection = None
+        atexit.unregister(self.close)
+    
     def _create_tables(self):
         """Create all necessary database tables."""
         cursor = self.connection.cursor()
@@ -332,8 +383,66 @@ class SocialDatabase:
             )
         """)
         
+        self._create_stat_counters(cursor)
+        
         self.connection.commit()
     
+    def _create_stat_counters(self, cursor):
+        """Create the trigger-maintained system_stats counters table."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS system_stats (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        
+        for name, (table, column, condition) in self.STAT_COUNTERS.items():
+            new_match = f"({condition.format(row='NEW')})" if condition else "1"
+            old_match = f"({condition.format(row='OLD')})" if condition else "1"
+            
+            # Seed from the current table contents the first time only
+            where = f"WHERE {condition.format(row=table)}" if condition else ""
+            cursor.execute(f"""
+                INSERT OR IGNORE INTO system_stats (name, value)
+                SELECT ?, COUNT(*) FROM {table} {where}
+            """, (name,))
+            
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{name}_ins AFTER INSERT ON {table}
+                BEGIN
+                    UPDATE system_stats SET value = value + {new_match} WHERE name = '{name}';
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{name}_del AFTER DELETE ON {table}
+                BEGIN
+                    UPDATE system_stats SET value = value - {old_match} WHERE name = '{name}';
+                END
+            """)
+            if column:
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{name}_upd AFTER UPDATE OF {column} ON {table}
+                    BEGIN
+                        UPDATE system_stats SET value = value + {new_match} - {old_match}
+                        WHERE name = '{name}';
+                    END
+                """)
+    
+    def get_stat_counters(self) -> Dict[str, int]:
+        """Get all system_stats counters in a single read."""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT name, value FROM system_stats")
+        return {row[0]: row[1] for row in cursor.fetchall()}
+    
+    def get_size_bytes(self) -> int:
+        """Get the database size from SQLite's page count and page size."""
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA page_count")
+        page_count = cursor.fetchone()[0]
+        cursor.execute("PRAGMA page_size")
+        page_size = cursor.fetchone()[0]
+        return page_count * page_size
+    
     def _insert_sample_data(self):
         """Insert sample data for demonstration."""
         cursor = self.connection.cursor()
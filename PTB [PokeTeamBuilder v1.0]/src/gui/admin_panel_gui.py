@@ -11,6 +11,8 @@ import logging
 from datetime import datetime, timedelta
 import sqlite3
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from src.gui.theme_manager import ThemeManager
 from src.features.social_community_hub import (
@@ -129,8 +131,91 @@ class AdminPanelFrame(tk.Frame):
         self.community_manager = CommunityManager()
         self.is_admin = False
         
+        # Per-thread database connections (see _get_conn), all recorded so
+        # _on_destroy can close them
+        self._thread_local = threading.local()
+        self._conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._conns_closed = False
+        
+        # Debounced user search state
+        self._search_after_id = None
+        self._search_executor: Optional[ThreadPoolExecutor] = None
+        self._search_generation = 0  # bumped per search; older results are dropped
+        
+        # Pending after() ids of _poll_future, which hands worker results to Tk
+        self._poll_after_ids = set()
+        
+        # Background database maintenance
+        self._maintenance_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Users currently shown in the tree, keyed by username
+        self._users_cache: Dict[str, tuple] = {}
+        self._users_iids: Dict[str, str] = {}
+        
+        # The panel is rebuilt on every visit, so release its database with it
+        self.bind("<Destroy>", self._on_destroy)
+        
         self._show_login()
     
+    def _on_destroy(self, event):
+        """Stop background work and close the community database."""
+        if event.widget is not self:
+            return
+        
+        # Drop any pending or in-flight search
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_generation += 1
+        for after_id in self._poll_after_ids:
+            self.after_cancel(after_id)
+        self._poll_after_ids.clear()
+        
+        for executor in (self._search_executor, self._maintenance_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        
+        # Close every per-thread connection; queued work that starts later
+        # can't open a new one
+        with self._conns_lock:
+            self._conns_closed = True
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self.community_manager.database.close()
+    
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get the calling thread's own connection to the community database.
+        
+        Under WAL, readers on separate connections don't serialize on a
+        shared connection, so background work can run concurrently.
+        """
+        conn = getattr(self._thread_local, "conn", None)
+        if conn is None:
+            with self._conns_lock:
+                if self._conns_closed:
+                    raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+                conn = self.community_manager.database.new_connection(
+                    cached_statements=256,
+                    isolation_level=None
+                )
+                self._conns.append(conn)
+            self._thread_local.conn = conn
+        return conn
+    
+    def _poll_future(self, future, on_done):
+        """Call on_done(future) on the Tk main loop once the worker has finished it."""
+        if future.done():
+            on_done(future)
+            return
+        
+        def poll():
+            self._poll_after_ids.discard(after_id)
+            self._poll_future(future, on_done)
+        
+        after_id = self.after(50, poll)
+        self._poll_after_ids.add(after_id)
+    
     def _show_login(self):
         """Show admin login dialog."""
         login_dialog = AdminLoginDialog(self)
@@ -372,30 +457,7 @@ class AdminPanelFrame(tk.Frame):
     
     def _get_system_stats(self) -> Dict[str, int]:
         """Get system statistics."""
-        cursor = self.community_manager.database.connection.cursor()
-        
-        # Total users
-        cursor.execute("SELECT COUNT(*) FROM users")
-        total_users = cursor.fetchone()[0]
-        
-        # Online users
-        cursor.execute("SELECT COUNT(*) FROM users WHERE status = 'online'")
-        online_users = cursor.fetchone()[0]
-        
-        # Verified users
-        cursor.execute("SELECT COUNT(*) FROM users WHERE email_verified = 1")
-        verified_users = cursor.fetchone()[0]
-        
-        # Total posts
-        cursor.execute("SELECT COUNT(*) FROM community_posts")
-        total_posts = cursor.fetchone()[0]
-        
-        return {
-            'total_users': total_users,
-            'online_users': online_users,
-            'verified_users': verified_users,
-            'total_posts': total_posts
-        }
+        return self.community_manager.database.get_stat_counters()
     
     def _load_recent_activity(self, text_widget):
         """Load recent activity into text widget."""
@@ -462,6 +524,7 @@ class AdminPanelFrame(tk.Frame):
         self.user_search_var = tk.StringVar()
         search_entry = tk.Entry(search_frame, textvariable=self.user_search_var, width=30)
         search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind("<KeyRelease>", lambda e: self._search_users())
         
         tk.Button(
             search_frame,
@@ -546,54 +609,92 @@ class AdminPanelFrame(tk.Frame):
     
     def _load_all_users(self):
         """Load all users into the tree view."""
-        # Clear existing items
-        for item in self.users_tree.get_children():
-            self.users_tree.delete(item)
+        # Any search still running is now out of date
+        self._search_generation += 1
         
         cursor = self.community_manager.database.connection.cursor()
         cursor.execute("""
-            SELECT username, display_name, email, level, status, email_verified, join_date 
+            SELECT username, display_name, email, level, status, 
+                   CASE email_verified WHEN 1 THEN '✓' ELSE '✗' END AS verified, 
+                   join_date 
             FROM users 
             ORDER BY join_date DESC
         """)
         
-        for row in cursor.fetchall():
-            verified = "✓" if row[5] else "✗"
-            self.users_tree.insert("", "end", values=(
-                row[0],  # username
-                row[1],  # display_name
-                row[2],  # email
-                row[3],  # level
-                row[4],  # status
-                verified,
-                row[6]   # join_date
-            ))
+        self._populate_users_tree(cursor.fetchall())
+    
+    def _populate_users_tree(self, rows):
+        """Replace the tree view contents with the given user rows."""
+        # Hide the columns while rebuilding so the tree lays out once
+        # at the end rather than after every row
+        self.users_tree.configure(displaycolumns=())
+        try:
+            # Clear existing items
+            self.users_tree.delete(*self.users_tree.get_children())
+            
+            self._users_cache = {}
+            self._users_iids = {}
+            
+            # Rows already match the tree columns (the verified mark is
+            # computed in SQL), so they are inserted as-is
+            for row in rows:
+                values = tuple(row)
+                iid = self.users_tree.insert("", "end", values=values)
+                self._users_cache[str(values[0])] = values
+                self._users_iids[str(values[0])] = iid
+        finally:
+            self.users_tree.configure(displaycolumns="#all")
     
     def _search_users(self):
-        """Search for users."""
+        """Search for users, debounced so rapid keystrokes run one query."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(200, self._do_search)
+    
+    def _do_search(self):
+        """Run the pending user search on the background worker."""
+        self._search_after_id = None
         search_term = self.user_search_var.get().strip()
         
         if not search_term:
             self._load_all_users()
             return
         
-        # Clear existing items
-        for item in self.users_tree.get_children():
-            self.users_tree.delete(item)
+        if self._search_executor is None:
+            self._search_executor = ThreadPoolExecutor(max_workers=1)
         
-        cursor = self.community_manager.database.connection.cursor()
-        cursor.execute("""
-            SELECT username, display_name, email, level, status, email_verified, join_date 
+        self._search_generation += 1
+        generation = self._search_generation
+        future = self._search_executor.submit(self._query_users, search_term)
+        self._poll_future(future, lambda f: self._on_search_done(f, generation))
+    
+    def _query_users(self, search_term: str):
+        """Execute the user search query (runs on the worker thread)."""
+        pattern = f"%{search_term}%"
+        cursor = self._get_conn().execute("""
+            SELECT username, display_name, email, level, status, 
+                   CASE email_verified WHEN 1 THEN '✓' ELSE '✗' END AS verified, 
+                   join_date 
             FROM users 
             WHERE username LIKE ? OR email LIKE ? OR display_name LIKE ?
             ORDER BY join_date DESC
-        """, (f"%{search_term}%", f"%{search_term}%", f"%{search_term}%"))
+        """, (pattern, pattern, pattern))
+        return cursor.fetchall()
+    
+    def _on_search_done(self, future, generation: int):
+        """Show a finished search; runs on the Tk main loop."""
+        try:
+            rows = future.result()
+        except Exception as e:
+            logger.error(f"User search failed: {e}")
+            return
         
-        for row in cursor.fetchall():
-            verified = "✓" if row[5] else "✗"
-            self.users_tree.insert("", "end", values=(
-                row[0], row[1], row[2], row[3], row[4], verified, row[6]
-            ))
+        self._show_search_results(rows, generation)
+    
+    def _show_search_results(self, rows, generation: int):
+        """Show search results unless a newer search or reload has superseded them."""
+        if generation == self._search_generation:
+            self._populate_users_tree(rows)
     
     def _view_user_details(self):
         """View selected user details."""
@@ -619,12 +720,13 @@ class AdminPanelFrame(tk.Frame):
         row = cursor.fetchone()
         
         if row:
-            text.insert(tk.END, f"{'='*50}\n")
-            text.insert(tk.END, f"USER DETAILS: {username}\n")
-            text.insert(tk.END, f"{'='*50}\n\n")
-            
-            for key in row.keys():
-                text.insert(tk.END, f"{key:<20}: {row[key]}\n")
+            # Build the whole report first so the widget gets one insert
+            lines = [f"{key:<20}: {row[key]}" for key in row.keys()]
+            text.insert(
+                tk.END,
+                f"{'='*50}\nUSER DETAILS: {username}\n{'='*50}\n\n"
+                + "\n".join(lines) + "\n"
+            )
         
         text.config(state=tk.DISABLED)
     
@@ -647,8 +749,12 @@ class AdminPanelFrame(tk.Frame):
             cursor.execute("DELETE FROM users WHERE username = ?", (username,))
             self.community_manager.database.connection.commit()
             
+            # Drop just the affected row instead of reloading every user
+            key = str(username)
+            self.users_tree.delete(self._users_iids.pop(key, selection[0]))
+            self._users_cache.pop(key, None)
+            
             messagebox.showinfo("Success", f"User '{username}' deleted")
-            self._load_all_users()
     
     def _verify_user_email(self):
         """Manually verify user's email."""
@@ -667,8 +773,14 @@ class AdminPanelFrame(tk.Frame):
         )
         self.community_manager.database.connection.commit()
         
+        # Flip the verified flag in place instead of reloading every user
+        key = str(username)
+        self.users_tree.set(self._users_iids.get(key, selection[0]), "Verified", "✓")
+        row = self._users_cache.get(key)
+        if row:
+            self._users_cache[key] = row[:5] + ("✓",) + row[6:]
+        
         messagebox.showinfo("Success", f"Email verified for user '{username}'")
-        self._load_all_users()
     
     def _ban_user(self):
         """Ban selected user."""
@@ -705,52 +817,115 @@ class AdminPanelFrame(tk.Frame):
         posts_frame = tk.LabelFrame(tab, text="Recent Posts", font=("Arial", 11, "bold"))
         posts_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Load posts
+        # Posts list: one Treeview instead of a frame of widgets per post
+        columns = ("Title", "Type", "Author", "Date")
+        self.posts_tree = ttk.Treeview(posts_frame, columns=columns, show="headings", height=15)
+        
+        for col in columns:
+            self.posts_tree.heading(col, text=col)
+            self.posts_tree.column(col, width=150)
+        self.posts_tree.column("Title", width=300)
+        
+        vsb = ttk.Scrollbar(posts_frame, orient="vertical", command=self.posts_tree.yview)
+        self.posts_tree.configure(yscrollcommand=vsb.set)
+        
+        self.posts_tree.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        vsb.grid(row=0, column=1, sticky="ns", pady=5)
+        
+        posts_frame.rowconfigure(0, weight=1)
+        posts_frame.columnconfigure(0, weight=1)
+        
+        # Load posts with their author in a single query
         cursor = self.community_manager.database.connection.cursor()
         cursor.execute("""
-            SELECT post_id, user_id, title, post_type, created_date 
-            FROM community_posts 
-            ORDER BY created_date DESC 
+            SELECT p.post_id, p.title, p.post_type, u.username, p.created_date 
+            FROM community_posts p 
+            LEFT JOIN users u ON u.user_id = p.user_id 
+            ORDER BY p.created_date DESC 
             LIMIT 20
         """)
         
         for row in cursor.fetchall():
-            post_item = tk.Frame(posts_frame, bg="#f8f9fa", relief=tk.RIDGE, bd=1)
-            post_item.pack(fill=tk.X, padx=5, pady=3)
-            
-            tk.Label(
-                post_item,
-                text=f"📝 {row[2]}",
-                font=("Arial", 10, "bold"),
-                bg="#f8f9fa"
-            ).pack(anchor=tk.W, padx=10, pady=5)
-            
-            tk.Label(
-                post_item,
-                text=f"Type: {row[3]} | Posted: {row[4]}",
-                font=("Arial", 8),
-                bg="#f8f9fa",
-                fg="gray"
-            ).pack(anchor=tk.W, padx=10)
-            
-            btn_frame = tk.Frame(post_item, bg="#f8f9fa")
-            btn_frame.pack(anchor=tk.E, padx=5, pady=5)
-            
-            tk.Button(
-                btn_frame,
-                text="View",
-                font=("Arial", 8),
-                bg="#3498db",
-                fg="white"
-            ).pack(side=tk.LEFT, padx=2)
+            self.posts_tree.insert("", "end", iid=row[0], values=(
+                f"📝 {row[1]}", row[2], row[3] or "Unknown", row[4]
+            ))
+        
+        # Action buttons shared by all posts, acting on the selection
+        action_frame = tk.Frame(tab)
+        action_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        tk.Button(
+            action_frame,
+            text="View Post",
+            bg="#3498db",
+            fg="white",
+            command=self._view_post
+        ).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(
+            action_frame,
+            text="Delete Post",
+            bg="#e74c3c",
+            fg="white",
+            command=self._delete_post
+        ).pack(side=tk.LEFT, padx=5)
+    
+    def _view_post(self):
+        """View selected post."""
+        selection = self.posts_tree.selection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a post")
+            return
+        
+        post_id = selection[0]
+        
+        cursor = self.community_manager.database.connection.cursor()
+        cursor.execute("SELECT * FROM community_posts WHERE post_id = ?", (post_id,))
+        row = cursor.fetchone()
+        
+        if not row:
+            messagebox.showerror("Error", "Post no longer exists")
+            self.posts_tree.delete(post_id)
+            return
+        
+        # Create details dialog
+        dialog = tk.Toplevel(self)
+        dialog.title(f"Post Details - {row['title']}")
+        dialog.geometry("500x600")
+        
+        text = scrolledtext.ScrolledText(dialog, font=("Courier", 10))
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        lines = [f"{key:<20}: {row[key]}" for key in row.keys()]
+        text.insert(
+            tk.END,
+            f"{'='*50}\nPOST DETAILS: {row['title']}\n{'='*50}\n\n"
+            + "\n".join(lines) + "\n"
+        )
+        
+        text.config(state=tk.DISABLED)
+    
+    def _delete_post(self):
+        """Delete selected post."""
+        selection = self.posts_tree.selection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a post")
+            return
+        
+        post_id = selection[0]
+        title = self.posts_tree.set(post_id, "Title")
+        
+        if messagebox.askyesno(
+            "Confirm Delete",
+            f"Are you sure you want to delete post '{title}'?\n\n"
+            "This action cannot be undone!"
+        ):
+            cursor = self.community_manager.database.connection.cursor()
+            cursor.execute("DELETE FROM community_posts WHERE post_id = ?", (post_id,))
+            self.community_manager.database.connection.commit()
             
-            tk.Button(
-                btn_frame,
-                text="Delete",
-                font=("Arial", 8),
-                bg="#e74c3c",
-                fg="white"
-            ).pack(side=tk.LEFT, padx=2)
+            self.posts_tree.delete(post_id)
+            messagebox.showinfo("Success", "Post deleted")
     
     def _create_system_stats_tab(self):
         """Create system statistics tab."""
@@ -761,8 +936,8 @@ class AdminPanelFrame(tk.Frame):
         stats_text = scrolledtext.ScrolledText(tab, font=("Courier", 10))
         stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Gather comprehensive stats
-        cursor = self.community_manager.database.connection.cursor()
+        # Gather comprehensive stats from the trigger-maintained counters
+        stats = self._get_system_stats()
         
         stats_text.insert(tk.END, "="*60 + "\n")
         stats_text.insert(tk.END, "SYSTEM STATISTICS\n")
@@ -771,47 +946,30 @@ class AdminPanelFrame(tk.Frame):
         # User stats
         stats_text.insert(tk.END, "USER STATISTICS:\n")
         stats_text.insert(tk.END, "-"*40 + "\n")
-        
-        cursor.execute("SELECT COUNT(*) FROM users")
-        stats_text.insert(tk.END, f"Total Users: {cursor.fetchone()[0]}\n")
-        
-        cursor.execute("SELECT COUNT(*) FROM users WHERE email_verified = 1")
-        stats_text.insert(tk.END, f"Verified Users: {cursor.fetchone()[0]}\n")
-        
-        cursor.execute("SELECT COUNT(*) FROM users WHERE status = 'online'")
-        stats_text.insert(tk.END, f"Online Users: {cursor.fetchone()[0]}\n")
+        stats_text.insert(tk.END, f"Total Users: {stats['total_users']}\n")
+        stats_text.insert(tk.END, f"Verified Users: {stats['verified_users']}\n")
+        stats_text.insert(tk.END, f"Online Users: {stats['online_users']}\n")
         
         # Content stats
         stats_text.insert(tk.END, "\nCONTENT STATISTICS:\n")
         stats_text.insert(tk.END, "-"*40 + "\n")
-        
-        cursor.execute("SELECT COUNT(*) FROM community_posts")
-        stats_text.insert(tk.END, f"Total Posts: {cursor.fetchone()[0]}\n")
-        
-        cursor.execute("SELECT COUNT(*) FROM team_shares")
-        stats_text.insert(tk.END, f"Shared Teams: {cursor.fetchone()[0]}\n")
-        
-        cursor.execute("SELECT COUNT(*) FROM battle_replays")
-        stats_text.insert(tk.END, f"Battle Replays: {cursor.fetchone()[0]}\n")
+        stats_text.insert(tk.END, f"Total Posts: {stats['total_posts']}\n")
+        stats_text.insert(tk.END, f"Shared Teams: {stats['shared_teams']}\n")
+        stats_text.insert(tk.END, f"Battle Replays: {stats['battle_replays']}\n")
         
         # Friendship stats
         stats_text.insert(tk.END, "\nSOCIAL STATISTICS:\n")
         stats_text.insert(tk.END, "-"*40 + "\n")
-        
-        cursor.execute("SELECT COUNT(*) FROM friendships")
-        stats_text.insert(tk.END, f"Total Friendships: {cursor.fetchone()[0]}\n")
-        
-        cursor.execute("SELECT COUNT(*) FROM friendships WHERE status = 'accepted'")
-        stats_text.insert(tk.END, f"Active Friendships: {cursor.fetchone()[0]}\n")
+        stats_text.insert(tk.END, f"Total Friendships: {stats['total_friendships']}\n")
+        stats_text.insert(tk.END, f"Active Friendships: {stats['active_friendships']}\n")
         
         # Database stats
         stats_text.insert(tk.END, "\nDATABASE STATISTICS:\n")
         stats_text.insert(tk.END, "-"*40 + "\n")
         
-        db_path = "data/social_community.db"
-        if os.path.exists(db_path):
-            db_size = os.path.getsize(db_path) / 1024  # KB
-            stats_text.insert(tk.END, f"Database Size: {db_size:.2f} KB\n")
+        # Ask SQLite for the size of the open database; no filesystem calls
+        db_size = self.community_manager.database.get_size_bytes() / 1024  # KB
+        stats_text.insert(tk.END, f"Database Size: {db_size:.2f} KB\n")
         
         stats_text.config(state=tk.DISABLED)
     
@@ -869,18 +1027,30 @@ class AdminPanelFrame(tk.Frame):
             width=20,
             command=self._view_schema
         ).pack(pady=10)
+        
+        tk.Button(
+            actions_frame,
+            text="Advanced: Full VACUUM",
+            font=("Arial", 9),
+            bg="#95a5a6",
+            fg="white",
+            width=20,
+            command=self._full_vacuum
+        ).pack(pady=(30, 10))
     
     def _backup_database(self):
         """Backup database."""
-        import shutil
-        from datetime import datetime
-        
         try:
             os.makedirs("backups", exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = f"backups/social_community_{timestamp}.db"
             
-            shutil.copy("data/social_community.db", backup_file)
+            # Online backup through SQLite so pages still in the WAL are included
+            backup_conn = sqlite3.connect(backup_file)
+            try:
+                self._get_conn().backup(backup_conn)
+            finally:
+                backup_conn.close()
             
             messagebox.showinfo(
                 "Success",
@@ -891,31 +1061,69 @@ class AdminPanelFrame(tk.Frame):
             messagebox.showerror("Error", f"Backup failed:\n{e}")
     
     def _optimize_database(self):
-        """Optimize database."""
-        cursor = self.community_manager.database.connection.cursor()
-        cursor.execute("VACUUM")
-        self.community_manager.database.connection.commit()
-        
-        messagebox.showinfo("Success", "Database optimized successfully!")
+        """Optimize database without blocking the GUI."""
+        # Cheap maintenance: refresh planner stats and reclaim free pages
+        # incrementally instead of rewriting the whole file
+        self._run_maintenance(
+            ("PRAGMA optimize", "ANALYZE", "PRAGMA incremental_vacuum(1000)"),
+            "Database optimized successfully!"
+        )
+    
+    def _full_vacuum(self):
+        """Rebuild the whole database file with VACUUM."""
+        if messagebox.askyesno(
+            "Full VACUUM",
+            "Rewrite the entire database file?\n\n"
+            "The database stays locked until it finishes and needs free "
+            "disk space equal to its current size."
+        ):
+            self._run_maintenance(("VACUUM",), "Database vacuumed successfully!")
+    
+    def _run_maintenance(self, statements, success_message: str):
+        """Run maintenance statements on a background thread."""
+        def maintenance_thread():
+            conn = self._get_conn()
+            for statement in statements:
+                conn.execute(statement).fetchall()
+        
+        if self._maintenance_executor is None:
+            self._maintenance_executor = ThreadPoolExecutor(max_workers=1)
+        future = self._maintenance_executor.submit(maintenance_thread)
+        self._poll_future(future, lambda f: self._on_maintenance_done(f, success_message))
+    
+    def _on_maintenance_done(self, future, success_message: str):
+        """Report a finished maintenance run; runs on the Tk main loop."""
+        error = future.exception()
+        if error is None:
+            messagebox.showinfo("Success", success_message)
+        else:
+            messagebox.showerror("Error", f"Database maintenance failed:\n{error}")
     
     def _export_json(self):
         """Export database to JSON."""
         import json
         
         try:
-            cursor = self.community_manager.database.connection.cursor()
+            cursor = self._get_conn().cursor()
             
             # Export users
             cursor.execute("SELECT * FROM users")
-            users = [dict(row) for row in cursor.fetchall()]
+            columns = [d[0] for d in cursor.description]
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             export_file = f"exports/users_{timestamp}.json"
             
             os.makedirs("exports", exist_ok=True)
             
+            # Stream rows straight from the cursor, sharing one column list
             with open(export_file, 'w') as f:
-                json.dump(users, f, indent=2, default=str)
+                f.write('[')
+                for i, row in enumerate(cursor):
+                    if i:
+                        f.write(',')
+                    f.write('\n  ')
+                    json.dump(dict(zip(columns, row)), f, default=str)
+                f.write('\n]\n')
             
             messagebox.showinfo(
                 "Success",
@@ -937,9 +1145,7 @@ class AdminPanelFrame(tk.Frame):
         text = scrolledtext.ScrolledText(dialog, font=("Courier", 9))
         text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        for row in cursor.fetchall():
-            if row[0]:
-                text.insert(tk.END, row[0] + ";\n\n")
+        text.insert(tk.END, "".join(row[0] + ";\n\n" for row in cursor if row[0]))
         
         text.config(state=tk.DISABLED)
     
@@ -7,20 +7,83 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
 import os
+import threading
+import logging
+from functools import lru_cache
+from typing import List
 
-# Add the src directory to the path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Add the project root to the path for imports when run outside run_gui.py
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
 
-from src.gui.theme_manager import ThemeManager
+from src.gui.theme_manager import ThemeManager, center_window
 from src.teambuilder.team import PokemonTeam, TeamFormat, TeamEra
 from src.battle.simulator import BattleSimulator
 from src.core.pokemon import Pokemon, ShadowPokemon, PokemonNature
 from src.utils.sprite_manager import get_sprite_manager
 
+logger = logging.getLogger(__name__)
+
+# Fixed section headers for the results panel
+_HDR_RESULTS = "🎯 BATTLE RESULTS\n" + "=" * 30 + "\n"
+_HDR_STATS = "📊 BATTLE STATISTICS\n" + "=" * 30 + "\n"
+_HDR_FINAL = "🏁 FINAL TEAM STATES\n" + "=" * 30 + "\n"
+_SEP = "=" * 50 + "\n\n"
+
+
+@lru_cache(maxsize=None)
+def _nature(value: str) -> PokemonNature:
+    """Cached PokemonNature lookup by value."""
+    return PokemonNature(value)
+
+
+@lru_cache(maxsize=None)
+def _team_format(value: str) -> TeamFormat:
+    """Cached TeamFormat lookup by value."""
+    return TeamFormat(value)
+
+
+@lru_cache(maxsize=None)
+def _team_era(value: str) -> TeamEra:
+    """Cached TeamEra lookup by value."""
+    return TeamEra(value)
+
+
+def _sample_specs(samples) -> tuple:
+    """Resolve sample team literals into (name, species_id, level, nature, is_shadow, moves)."""
+    return tuple(
+        (name, species_id, level, _nature(nature), is_shadow, tuple(f"{name} Move {i}" for i in (1, 2, 3, 4)))
+        for name, species_id, level, nature, is_shadow in samples
+    )
+
+
+# Sample teams used for demonstration, resolved once at import
+_PLAYER_SAMPLE_SPECS = _sample_specs([
+    ("Shadow Bulbasaur", 1, 50, "hardy", True),
+    ("Shadow Charmander", 4, 50, "adamant", True),
+    ("Squirtle", 7, 50, "modest", False),
+    ("Pikachu", 25, 50, "timid", False),
+    ("Eevee", 133, 50, "jolly", False),
+    ("Mewtwo", 150, 50, "modest", False)
+])
+
+_OPPONENT_SAMPLE_SPECS = _sample_specs([
+    ("Pikachu", 25, 50, "timid", False),
+    ("Charmander", 4, 50, "adamant", False),
+    ("Bulbasaur", 1, 50, "modest", False),
+    ("Squirtle", 7, 50, "bold", False),
+    ("Rattata", 19, 50, "jolly", False),
+    ("Pidgey", 16, 50, "timid", False)
+])
+
 
 class BattleSimulatorFrame(tk.Frame):
     """Battle Simulator interface frame."""
     
+    # Oldest lines are dropped from the results/log widgets past this size
+    MAX_LOG_LINES = 2000
+    
     def __init__(self, parent, theme_manager: ThemeManager):
         super().__init__(parent)
         self.theme_manager = theme_manager
@@ -28,9 +91,20 @@ class BattleSimulatorFrame(tk.Frame):
         self.opponent_team = None
         self.battle_simulator = BattleSimulator()
         self.battle_result = None
+        self._log_summary = None
         self.ai_manager = None
         self.sprite_manager = get_sprite_manager()
         
+        # AI opponent dialog, built on first use and reused afterwards
+        self._ai_dialog = None
+        self._ai_dialog_open = tk.BooleanVar(value=False)
+        self._ai_opponents = []
+        self._ai_selected_name = None
+        self._opponents_cache = None
+        self._opponent_display_texts = []
+        self._opponent_descriptions = []
+        self._ai_select_after_id = None
+        
         self._initialize_ai_system()
         self._create_widgets()
         self._create_sample_teams()
@@ -55,6 +129,15 @@ class BattleSimulatorFrame(tk.Frame):
         )
         title_label.pack(pady=10)
         
+        # Status line for non-fatal errors
+        self.status_label = self.theme_manager.create_styled_label(
+            self,
+            text="",
+            style="error",
+            font=('Arial', 10)
+        )
+        self.status_label.pack()
+        
         # Team setup section
         teams_frame = self.theme_manager.create_styled_frame(self)
         teams_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -190,12 +273,12 @@ class BattleSimulatorFrame(tk.Frame):
         turns_entry.pack(side=tk.LEFT, padx=(0, 20))
         
         # Start battle button
-        start_battle_btn = self.theme_manager.create_styled_button(
+        self.start_battle_btn = self.theme_manager.create_styled_button(
             battle_settings_frame,
             text="⚔️ Start Battle!",
             command=self._start_battle
         )
-        start_battle_btn.pack(pady=10)
+        self.start_battle_btn.pack(pady=10)
         
         # Team display section
         teams_display_frame = self.theme_manager.create_styled_frame(self)
@@ -282,11 +365,11 @@ class BattleSimulatorFrame(tk.Frame):
         try:
             team_name = self.player_team_name.get()
             if not team_name.strip():
-                messagebox.showerror("Error", "Player team name cannot be empty!")
+                self._report_error("Player team name cannot be empty!")
                 return
             
-            format_value = TeamFormat(self.player_format.get())
-            era_value = TeamEra(self.player_era.get())
+            format_value = _team_format(self.player_format.get())
+            era_value = _team_era(self.player_era.get())
             
             self.player_team = PokemonTeam(
                 name=team_name,
@@ -296,51 +379,24 @@ class BattleSimulatorFrame(tk.Frame):
             )
             
             # Add some sample Pokemon
-            sample_pokemon = [
-                ("Shadow Bulbasaur", 1, 50, "hardy", True),
-                ("Shadow Charmander", 4, 50, "adamant", True),
-                ("Squirtle", 7, 50, "modest", False),
-                ("Pikachu", 25, 50, "timid", False),
-                ("Eevee", 133, 50, "jolly", False),
-                ("Mewtwo", 150, 50, "modest", False)
-            ]
-            
-            for name, species_id, level, nature, is_shadow in sample_pokemon:
-                if is_shadow:
-                    pokemon = ShadowPokemon(
-                        name=name,
-                        species_id=species_id,
-                        level=level,
-                        nature=PokemonNature(nature),
-                        moves=[f"{name} Move 1", f"{name} Move 2", f"{name} Move 3", f"{name} Move 4"]
-                    )
-                else:
-                    pokemon = Pokemon(
-                        name=name,
-                        species_id=species_id,
-                        level=level,
-                        nature=PokemonNature(nature),
-                        moves=[f"{name} Move 1", f"{name} Move 2", f"{name} Move 3", f"{name} Move 4"]
-                    )
-                
-                self.player_team.add_pokemon(pokemon)
+            self.player_team.extend(self._build_sample_pokemon(_PLAYER_SAMPLE_SPECS))
             
             self._update_team_status()
             self._update_results("✅ Player team created successfully!")
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to create player team: {str(e)}")
+            self._report_error(f"Failed to create player team: {str(e)}")
     
     def _create_opponent_team(self):
         """Create the opponent team."""
         try:
             team_name = self.opponent_team_name.get()
             if not team_name.strip():
-                messagebox.showerror("Error", "Opponent team name cannot be empty!")
+                self._report_error("Opponent team name cannot be empty!")
                 return
             
-            format_value = TeamFormat(self.opponent_format.get())
-            era_value = TeamEra(self.opponent_era.get())
+            format_value = _team_format(self.opponent_format.get())
+            era_value = _team_era(self.opponent_era.get())
             
             self.opponent_team = PokemonTeam(
                 name=team_name,
@@ -350,31 +406,35 @@ class BattleSimulatorFrame(tk.Frame):
             )
             
             # Add some sample Pokemon
-            sample_pokemon = [
-                ("Pikachu", 25, 50, "timid"),
-                ("Charmander", 4, 50, "adamant"),
-                ("Bulbasaur", 1, 50, "modest"),
-                ("Squirtle", 7, 50, "bold"),
-                ("Rattata", 19, 50, "jolly"),
-                ("Pidgey", 16, 50, "timid")
-            ]
-            
-            for name, species_id, level, nature in sample_pokemon:
-                pokemon = Pokemon(
-                    name=name,
-                    species_id=species_id,
-                    level=level,
-                    nature=PokemonNature(nature),
-                    moves=[f"{name} Move 1", f"{name} Move 2", f"{name} Move 3", f"{name} Move 4"]
-                )
-                
-                self.opponent_team.add_pokemon(pokemon)
+            self.opponent_team.extend(self._build_sample_pokemon(_OPPONENT_SAMPLE_SPECS))
             
             self._update_team_status()
             self._update_results("✅ Opponent team created successfully!")
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to create opponent team: {str(e)}")
+            self._report_error(f"Failed to create opponent team: {str(e)}")
+    
+    @staticmethod
+    def _build_sample_pokemon(specs) -> List[Pokemon]:
+        """Instantiate fresh Pokemon from pre-resolved sample specs."""
+        return [
+            (ShadowPokemon if is_shadow else Pokemon)(
+                name=name,
+                species_id=species_id,
+                level=level,
+                nature=nature,
+                moves=list(moves)
+            )
+            for name, species_id, level, nature, is_shadow, moves in specs
+        ]
+    
+    def _report_error(self, msg: str, fatal: bool = False):
+        """Show an error; only fatal errors interrupt the user with a modal dialog."""
+        logger.error(msg)
+        if fatal:
+            messagebox.showerror("Error", msg)
+        else:
+            self.status_label.config(text=msg)
     
     def _update_team_status(self):
         """Update the team status display."""
@@ -393,7 +453,7 @@ class BattleSimulatorFrame(tk.Frame):
     def _start_battle(self):
         """Start the battle simulation."""
         if not self.player_team or not self.opponent_team:
-            messagebox.showerror("Error", "Please create both teams before starting a battle!")
+            self._report_error("Please create both teams before starting a battle!")
             return
         
         try:
@@ -402,66 +462,102 @@ class BattleSimulatorFrame(tk.Frame):
             max_turns = int(self.max_turns.get())
             
             if max_turns <= 0:
-                messagebox.showerror("Error", "Max turns must be greater than 0!")
+                self._report_error("Max turns must be greater than 0!")
                 return
             
             # Clear previous results
             self._clear_results()
             
             # Start battle simulation
-            self._update_results("⚔️ Battle starting...\n")
-            self._update_results(f"Player Team: {self.player_team.name}\n")
-            self._update_results(f"Opponent Team: {self.opponent_team.name}\n")
-            self._update_results(f"AI Difficulty: {ai_difficulty.title()}\n")
-            self._update_results(f"Max Turns: {max_turns}\n")
-            self._update_results("=" * 50 + "\n\n")
-            
-            # Simulate battle
-            self.battle_result = self.battle_simulator.simulate_battle(
-                player_team=self.player_team,
-                opponent_team=self.opponent_team,
-                max_turns=max_turns,
-                ai_difficulty=ai_difficulty
-            )
-            
-            # Display battle results
-            self._display_battle_results()
+            self._flush_results([
+                "⚔️ Battle starting...\n",
+                f"Player Team: {self.player_team.name}\n",
+                f"Opponent Team: {self.opponent_team.name}\n",
+                f"AI Difficulty: {ai_difficulty.capitalize()}\n",
+                f"Max Turns: {max_turns}\n",
+                _SEP
+            ])
+            
+            # Simulate battle in a separate thread to prevent UI freezing
+            player_team = self.player_team
+            opponent_team = self.opponent_team
+            self.start_battle_btn.config(state=tk.DISABLED)
+            
+            def battle_thread():
+                try:
+                    result = self.battle_simulator.simulate_battle(
+                        player_team=player_team,
+                        opponent_team=opponent_team,
+                        max_turns=max_turns,
+                        ai_difficulty=ai_difficulty
+                    )
+                    log_summary = result.battle_log.get_summary()
+                    
+                    # Update UI in main thread
+                    self.after(0, self._on_battle_done, result, log_summary)
+                    
+                except Exception as e:
+                    error = str(e)
+                    self.after(0, lambda: self._on_battle_failed(error))
             
-            # Display battle log
-            self._display_battle_log()
+            threading.Thread(target=battle_thread, daemon=True).start()
             
         except ValueError as e:
-            messagebox.showerror("Error", f"Invalid input: {str(e)}")
+            self._report_error(f"Invalid input: {str(e)}")
         except Exception as e:
-            messagebox.showerror("Error", f"Battle simulation failed: {str(e)}")
+            self.start_battle_btn.config(state=tk.NORMAL)
+            self._report_error(f"Battle simulation failed: {str(e)}")
+    
+    def _on_battle_done(self, result, log_summary: str):
+        """Show a finished simulation; runs on the Tk main loop."""
+        self.start_battle_btn.config(state=tk.NORMAL)
+        self.battle_result = result
+        self._log_summary = log_summary
+        
+        # Display battle results
+        self._display_battle_results()
+        
+        # Display battle log
+        self._display_battle_log()
+    
+    def _on_battle_failed(self, error: str):
+        """Report a simulation error raised in the worker thread."""
+        self.start_battle_btn.config(state=tk.NORMAL)
+        self._report_error(f"Battle simulation failed: {error}")
     
     def _display_battle_results(self):
         """Display the battle results."""
         if not self.battle_result:
             return
         
+        lines = []
+        
         # Battle outcome
-        self._update_results("🎯 BATTLE RESULTS\n")
-        self._update_results("=" * 30 + "\n")
-        self._update_results(self.battle_result.get_result_text() + "\n\n")
+        lines.append(_HDR_RESULTS)
+        lines.append(self.battle_result.get_result_text() + "\n\n")
         
         # Battle statistics
         stats = self.battle_simulator.get_battle_statistics(self.battle_result)
-        self._update_results("📊 BATTLE STATISTICS\n")
-        self._update_results("=" * 30 + "\n")
-        self._update_results(f"Turns Taken: {stats['turns_taken']}\n")
-        self._update_results(f"Player Pokemon Fainted: {stats['player_pokemon_fainted']}\n")
-        self._update_results(f"Opponent Pokemon Fainted: {stats['opponent_pokemon_fainted']}\n")
-        self._update_results(f"Total Events: {stats['total_events']}\n")
-        self._update_results(f"Move Events: {stats['move_events']}\n")
-        self._update_results(f"Damage Events: {stats['damage_events']}\n")
-        self._update_results(f"Faint Events: {stats['faint_events']}\n\n")
+        lines.append(
+            _HDR_STATS +
+            f"Turns Taken: {stats['turns_taken']}\n"
+            f"Player Pokemon Fainted: {stats['player_pokemon_fainted']}\n"
+            f"Opponent Pokemon Fainted: {stats['opponent_pokemon_fainted']}\n"
+            f"Total Events: {stats['total_events']}\n"
+            f"Move Events: {stats['move_events']}\n"
+            f"Damage Events: {stats['damage_events']}\n"
+            f"Faint Events: {stats['faint_events']}\n\n"
+        )
         
         # Team final states
-        self._update_results("🏁 FINAL TEAM STATES\n")
-        self._update_results("=" * 30 + "\n")
-        self._update_results(self.battle_result.get_team_summary(True) + "\n\n")
-        self._update_results(self.battle_result.get_team_summary(False) + "\n\n")
+        parts = [
+            self.battle_result.get_team_summary(True),
+            self.battle_result.get_team_summary(False)
+        ]
+        lines.append(_HDR_FINAL + "\n\n".join(parts) + "\n\n")
+        
+        # Single insert for the whole report
+        self._flush_results(lines)
     
     def _display_battle_log(self):
         """Display the battle log."""
@@ -472,9 +568,12 @@ class BattleSimulatorFrame(tk.Frame):
         self.battle_log_text.config(state=tk.NORMAL)
         self.battle_log_text.delete(1.0, tk.END)
         
-        # Display battle log
-        log_text = self.battle_result.battle_log.get_summary()
+        # Display battle log (summary is built by the simulation thread)
+        log_text = self._log_summary
+        if log_text is None:
+            log_text = self.battle_result.battle_log.get_summary()
         self.battle_log_text.insert(1.0, log_text)
+        self._trim_text(self.battle_log_text)
         
         self.battle_log_text.config(state=tk.DISABLED)
     
@@ -490,13 +589,27 @@ class BattleSimulatorFrame(tk.Frame):
     
     def _update_results(self, text: str):
         """Update the results display."""
+        # Output means the last action succeeded, so drop any stale error
+        self.status_label.config(text="")
+        
         self.results_text.config(state=tk.NORMAL)
         self.results_text.insert(tk.END, text)
+        self._trim_text(self.results_text)
         self.results_text.config(state=tk.DISABLED)
         
         # Auto-scroll to bottom
         self.results_text.see(tk.END)
     
+    def _trim_text(self, text_widget: tk.Text):
+        """Drop the oldest lines so the widget holds at most MAX_LOG_LINES."""
+        line_count = int(text_widget.index('end-1c').split('.')[0])
+        if line_count > self.MAX_LOG_LINES:
+            text_widget.delete('1.0', f'{line_count - self.MAX_LOG_LINES}.0')
+    
+    def _flush_results(self, text_chunks: List[str]):
+        """Write several chunks to the results display in one insert."""
+        self._update_results("".join(text_chunks))
+    
     def _create_ai_opponent(self):
         """Create an AI opponent team."""
         if not self.ai_manager:
@@ -504,96 +617,46 @@ class BattleSimulatorFrame(tk.Frame):
             return
         
         try:
-            # Get available AI opponents
-            opponents = self.ai_manager.get_available_opponents()
+            # Get available AI opponents (static for the session, so cached)
+            if self._opponents_cache is None:
+                opponents = self.ai_manager.get_available_opponents()
+                self._opponents_cache = opponents
+                self._opponent_display_texts = [
+                    f"{opponent['name']} ({opponent['difficulty'].capitalize()}) - {opponent['personality'].replace('_', ' ').title()}"
+                    for opponent in opponents
+                ]
+                self._opponent_descriptions = [
+                    self._format_opponent_details(opponent) for opponent in opponents
+                ]
+            opponents = self._opponents_cache
             if not opponents:
                 messagebox.showerror("Error", "No AI opponents available!")
                 return
             
-            # Create selection dialog
-            ai_dialog = tk.Toplevel(self)
-            ai_dialog.title("Select AI Opponent")
-            ai_dialog.geometry("400x500")
-            ai_dialog.transient(self)
-            ai_dialog.grab_set()
-            
-            # Center the dialog
-            ai_dialog.update_idletasks()
-            x = (ai_dialog.winfo_screenwidth() // 2) - (ai_dialog.winfo_width() // 2)
-            y = (ai_dialog.winfo_screenheight() // 2) - (ai_dialog.winfo_height() // 2)
-            ai_dialog.geometry(f"+{x}+{y}")
-            
-            # Dialog content
-            tk.Label(ai_dialog, text="Select AI Opponent:", font=('Arial', 12, 'bold')).pack(pady=10)
-            
-            # Listbox for opponents
-            listbox_frame = tk.Frame(ai_dialog)
-            listbox_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-            
-            opponent_listbox = tk.Listbox(listbox_frame, height=15)
-            opponent_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            
-            scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=opponent_listbox.yview)
-            opponent_listbox.configure(yscrollcommand=scrollbar.set)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            
-            # Populate listbox
-            for opponent in opponents:
-                display_text = f"{opponent['name']} ({opponent['difficulty'].title()}) - {opponent['personality'].title()}"
-                opponent_listbox.insert(tk.END, display_text)
-            
-            # Details text
-            details_text = tk.Text(ai_dialog, height=8, wrap=tk.WORD, state=tk.DISABLED)
-            details_text.pack(fill=tk.X, padx=20, pady=10)
-            
-            def on_opponent_select(event):
-                selection = opponent_listbox.curselection()
-                if selection:
-                    index = selection[0]
-                    opponent_data = opponents[index]
-                    
-                    details_text.config(state=tk.NORMAL)
-                    details_text.delete(1.0, tk.END)
-                    
-                    details = f"""Name: {opponent_data['name']}
-Difficulty: {opponent_data['difficulty'].title()}
-Personality: {opponent_data['personality'].title()}
-Team Size: {opponent_data['team_size']}/6 Pokemon
-
-Description: {opponent_data['description']}"""
-                    
-                    details_text.insert(1.0, details)
-                    details_text.config(state=tk.DISABLED)
-            
-            opponent_listbox.bind('<<ListboxSelect>>', on_opponent_select)
+            # Build the selection dialog once, then reuse it
+            if self._ai_dialog is None or not self._ai_dialog.winfo_exists():
+                self._build_ai_dialog()
+            else:
+                self._ai_dialog.deiconify()
             
-            # Buttons
-            button_frame = tk.Frame(ai_dialog)
-            button_frame.pack(fill=tk.X, padx=20, pady=10)
+            # Refresh dialog contents
+            self._ai_opponents = opponents
+            self._ai_selected_name = None
+            self._ai_listbox.delete(0, tk.END)
+            self._ai_listbox.insert(tk.END, *self._opponent_display_texts)
             
-            selected_opponent = [None]  # Use list to modify from inner function
+            self._ai_details_text.config(state=tk.NORMAL)
+            self._ai_details_text.delete(1.0, tk.END)
+            self._ai_details_text.config(state=tk.DISABLED)
             
-            def select_opponent():
-                selection = opponent_listbox.curselection()
-                if selection:
-                    index = selection[0]
-                    selected_opponent[0] = opponents[index]['name']
-                    ai_dialog.destroy()
-                else:
-                    messagebox.showwarning("No Selection", "Please select an AI opponent.")
-            
-            def cancel_selection():
-                ai_dialog.destroy()
-            
-            tk.Button(button_frame, text="Select", command=select_opponent, bg='#4CAF50', fg='white').pack(side=tk.LEFT, padx=5)
-            tk.Button(button_frame, text="Cancel", command=cancel_selection, bg='#f44336', fg='white').pack(side=tk.RIGHT, padx=5)
-            
-            # Wait for dialog to close
-            ai_dialog.wait_window()
+            # Wait for the dialog to be dismissed
+            self._ai_dialog.grab_set()
+            self._ai_dialog_open.set(True)
+            self.wait_variable(self._ai_dialog_open)
             
             # Create AI opponent team if one was selected
-            if selected_opponent[0]:
-                ai_opponent = self.ai_manager.get_opponent(selected_opponent[0])
+            if self._ai_selected_name:
+                ai_opponent = self.ai_manager.get_opponent(self._ai_selected_name)
                 if ai_opponent:
                     self.opponent_team = ai_opponent.team
                     self.opponent_team_name.set(f"{ai_opponent.name} (AI)")
@@ -605,3 +668,93 @@ Description: {opponent_data['description']}"""
         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create AI opponent: {str(e)}")
+    
+    def _build_ai_dialog(self):
+        """Create the AI opponent selection dialog."""
+        ai_dialog = tk.Toplevel(self)
+        ai_dialog.title("Select AI Opponent")
+        ai_dialog.transient(self)
+        ai_dialog.protocol("WM_DELETE_WINDOW", self._close_ai_dialog)
+        
+        center_window(ai_dialog, 400, 500)
+        
+        # Dialog content
+        tk.Label(ai_dialog, text="Select AI Opponent:", font=('Arial', 12, 'bold')).pack(pady=10)
+        
+        # Listbox for opponents
+        listbox_frame = tk.Frame(ai_dialog)
+        listbox_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        
+        opponent_listbox = tk.Listbox(listbox_frame, height=15)
+        opponent_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=opponent_listbox.yview)
+        opponent_listbox.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Details text
+        details_text = tk.Text(ai_dialog, height=8, wrap=tk.WORD, state=tk.DISABLED)
+        details_text.pack(fill=tk.X, padx=20, pady=10)
+        
+        opponent_listbox.bind('<<ListboxSelect>>', self._on_ai_opponent_select)
+        
+        # Buttons
+        button_frame = tk.Frame(ai_dialog)
+        button_frame.pack(fill=tk.X, padx=20, pady=10)
+        
+        tk.Button(button_frame, text="Select", command=self._select_ai_opponent, bg='#4CAF50', fg='white').pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Cancel", command=self._close_ai_dialog, bg='#f44336', fg='white').pack(side=tk.RIGHT, padx=5)
+        
+        self._ai_dialog = ai_dialog
+        self._ai_listbox = opponent_listbox
+        self._ai_details_text = details_text
+    
+    @staticmethod
+    def _format_opponent_details(opponent_data: dict) -> str:
+        """Format the details panel text for an AI opponent."""
+        return f"""Name: {opponent_data['name']}
+Difficulty: {opponent_data['difficulty'].capitalize()}
+Personality: {opponent_data['personality'].replace('_', ' ').title()}
+Team Size: {opponent_data['team_size']}/6 Pokemon
+
+Description: {opponent_data['description']}"""
+    
+    def _on_ai_opponent_select(self, event):
+        """Show details for the highlighted AI opponent, coalescing rapid changes."""
+        selection = self._ai_listbox.curselection()
+        if not selection:
+            return
+        
+        if self._ai_select_after_id is not None:
+            self.after_cancel(self._ai_select_after_id)
+        
+        details = self._opponent_descriptions[selection[0]]
+        self._ai_select_after_id = self.after(50, lambda: self._show_ai_opponent_details(details))
+    
+    def _show_ai_opponent_details(self, details: str):
+        """Replace the AI opponent details text."""
+        self._ai_select_after_id = None
+        self._ai_details_text.config(state=tk.NORMAL)
+        self._ai_details_text.delete(1.0, tk.END)
+        self._ai_details_text.insert(1.0, details)
+        self._ai_details_text.config(state=tk.DISABLED)
+    
+    def _select_ai_opponent(self):
+        """Accept the highlighted AI opponent and hide the dialog."""
+        selection = self._ai_listbox.curselection()
+        if selection:
+            index = selection[0]
+            self._ai_selected_name = self._ai_opponents[index]['name']
+            self._close_ai_dialog()
+        else:
+            messagebox.showwarning("No Selection", "Please select an AI opponent.")
+    
+    def _close_ai_dialog(self):
+        """Hide the AI opponent dialog so it can be shown again later."""
+        if self._ai_select_after_id is not None:
+            self.after_cancel(self._ai_select_after_id)
+            self._ai_select_after_id = None
+        
+        self._ai_dialog.grab_release()
+        self._ai_dialog.withdraw()
+        self._ai_dialog_open.set(False)
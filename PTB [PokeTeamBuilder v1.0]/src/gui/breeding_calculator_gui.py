@@ -11,7 +11,11 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional, List, Dict, Any
 from enum import Enum
+from functools import lru_cache
+from contextlib import contextmanager
 import logging
+import random
+import re
 
 from src.gui.theme_manager import ThemeManager
 # Temporarily disabled - API mismatch with GeneticBreedingCalculator
@@ -43,9 +47,165 @@ class BreedingPokemon:
     """Stub for compatibility."""
     pass
 
+# Combobox choices, built once at import
+_NATURE_VALUES = tuple(n.value.capitalize() for n in PokemonNature)
+_HELD_ITEM_VALUES = tuple(i.value.replace('_', ' ').title() for i in HeldItem)
+_POKEMON_CHOICES = ("Ditto", "Charizard", "Blastoise", "Venusaur", "Pikachu", "Dragonite")
+
+# A valid IV entry: a whole number from 0 to 31
+_IV_RE = re.compile(r'^([0-9]|[12][0-9]|3[01])$')
+
+# Species data for the selectable parents
+_SPECIES_ID_MAP = {
+    "Ditto": 132,
+    "Charizard": 6,
+    "Blastoise": 9,
+    "Venusaur": 3,
+    "Pikachu": 25,
+    "Dragonite": 149
+}
+
+_EGG_GROUPS_MAP = {
+    "Ditto": (EggGroup.DITTO,),
+    "Charizard": (EggGroup.MONSTER, EggGroup.DRAGON),
+    "Blastoise": (EggGroup.MONSTER, EggGroup.WATER_1),
+    "Venusaur": (EggGroup.MONSTER, EggGroup.GRASS),
+    "Pikachu": (EggGroup.FIELD, EggGroup.FAIRY),
+    "Dragonite": (EggGroup.WATER_1, EggGroup.DRAGON)
+}
+
+# Flat placeholder stats shared by the calculator's stand-in Pokemon
+_PLACEHOLDER_BASE_STATS = BaseStats(hp=50, attack=50, defense=50, special_attack=50, special_defense=50, speed=50)
+
+def _pack_ivs(iv: IV) -> int:
+    """Pack six 0-31 IVs into one int, 5 bits per stat (HP in the low bits)."""
+    return (iv.hp | iv.attack << 5 | iv.defense << 10 |
+            iv.special_attack << 15 | iv.special_defense << 20 | iv.speed << 25)
+
+def _count_perfect_ivs(packed: int) -> int:
+    """Count the 31-valued lanes in a packed IV spread."""
+    return sum(((packed >> shift) & 0x1F) == 31 for shift in (0, 5, 10, 15, 20, 25))
+
+@lru_cache(maxsize=None)
+def _nature_from_string(value: str) -> PokemonNature:
+    """Cached PokemonNature lookup by value."""
+    return PokemonNature(value)
+
+@lru_cache(maxsize=64)
+def _held_item_or_none(value: str) -> Optional[HeldItem]:
+    """Cached HeldItem lookup; 'none' and unknown items map to None."""
+    if value == "none":
+        return None
+    try:
+        return HeldItem(value)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=None)
+def _pretty_group(group: EggGroup) -> str:
+    """Display name for an egg group."""
+    return group.value.title().replace('_', ' ')
+
+@lru_cache(maxsize=None)
+def _pretty_nature(nature: PokemonNature) -> str:
+    """Display name for a nature."""
+    return nature.value.capitalize()
+
+@lru_cache(maxsize=None)
+def _pretty_item(item: Optional[HeldItem]) -> str:
+    """Display name for a held item, 'None' when no item is held."""
+    return item.value.replace('_', ' ').title() if item else 'None'
+
+# Layout of the breeding results report, filled with str.format_map
+_RESULTS_TEMPLATE = """🥚 BREEDING CALCULATION RESULTS
+""" + "=" * 50 + """
+
+PARENT INFORMATION:
+Parent 1: {p1_name} ({p1_gender})
+- Nature: {p1_nature}
+- Held Item: {p1_item}
+- IVs: {p1_ivs}
+- Egg Groups: {p1_egg_groups}
+
+Parent 2: {p2_name} ({p2_gender})
+- Nature: {p2_nature}
+- Held Item: {p2_item}
+- IVs: {p2_ivs}
+- Egg Groups: {p2_egg_groups}
+
+OFFSPRING RESULT:
+Species: {offspring_name}
+Level: {offspring_level}
+Nature: {offspring_nature} (inherited from: {nature_inheritance})
+
+FINAL IVs:
+HP: {iv_hp} (from: {from_hp})
+Attack: {iv_attack} (from: {from_attack})
+Defense: {iv_defense} (from: {from_defense})
+Sp. Attack: {iv_special_attack} (from: {from_special_attack})
+Sp. Defense: {iv_special_defense} (from: {from_special_defense})
+Speed: {iv_speed} (from: {from_speed})
+
+BREEDING STATISTICS:
+Success Rate: {success_rate:.6f} ({success_pct:.4f}%)
+Estimated Generations: {generation_estimate}
+Perfect IVs: {perfect_ivs}/6
+
+BREEDING TIPS:
+• Use Destiny Knot to inherit 5 IVs from parents
+• Use Everstone to guarantee nature inheritance
+• Use Power items to guarantee specific IV inheritance
+• Keep the best offspring for next generation breeding
+• Consider using different parent combinations for optimization
+
+"""
+
 class BreedingCalculatorFrame(tk.Frame):
     """Breeding Calculator interface frame (currently disabled)."""
     
+    # IV entry row: stat labels and their (label column, entry column) pairs
+    _IV_STATS = ("HP", "Att", "Def", "SpA", "SpD", "Spe")
+    _IV_COLS = tuple((i * 2, i * 2 + 1) for i in range(6))
+    
+    # IV variable keys and the matching IV field names, in the same order
+    _IV_KEYS = ('hp', 'att', 'def', 'spa', 'spd', 'spe')
+    _IV_FIELDS = ('hp', 'attack', 'defense', 'special_attack', 'special_defense', 'speed')
+    
+    # Choices offered by the random example
+    _RANDOM_GENDERS = ("male", "female", "genderless")
+    _RANDOM_ITEMS = ("Destiny Knot", "Everstone", "None")
+    
+    # Status label colours by message kind
+    _STATUS_COLORS = {'error': 'red', 'warn': 'orange', 'info': 'black'}
+    
+    # (variable key, label, choices, grid row, grid column) for each parent selector
+    _PARENT_COMBOS = (
+        ('pokemon', "Pokemon:", _POKEMON_CHOICES, 0, 0),
+        ('gender', "Gender:", _RANDOM_GENDERS, 0, 2),
+        ('nature', "Nature:", _NATURE_VALUES, 1, 0),
+        ('item', "Held Item:", ("None",) + _HELD_ITEM_VALUES, 1, 2)
+    )
+    
+    # Starting values for each parent block
+    _PARENT_DEFAULTS = {
+        'p1': {
+            'label': "Parent 1:",
+            'pokemon': "Ditto",
+            'gender': "genderless",
+            'nature': "Hardy",
+            'item': "Destiny Knot",
+            'ivs': ("31", "31", "31", "31", "31", "31")
+        },
+        'p2': {
+            'label': "Parent 2:",
+            'pokemon': "Charizard",
+            'gender': "male",
+            'nature': "Adamant",
+            'item': "Everstone",
+            'ivs': ("25", "31", "25", "25", "25", "31")
+        }
+    }
+    
     def __init__(self, parent, theme_manager: ThemeManager):
         super().__init__(parent)
         self.theme_manager = theme_manager
@@ -53,6 +213,16 @@ class BreedingCalculatorFrame(tk.Frame):
         self.parent1 = None
         self.parent2 = None
         self.breeding_result = None
+        self.parent_vars = {}
+        self._bp_cache: Dict[tuple, BreedingPokemon] = {}
+        self._rng = random.Random()
+        
+        # Input signatures of the last shown result/guide; the parent tuples keep
+        # the objects alive so their ids cannot be reused by new ones
+        self._last_calc_sig = None
+        self._last_calc_parents = None
+        self._last_guide_sig = None
+        self._last_guide_parents = None
         
         # Display disabled message
         msg = tk.Label(
@@ -79,6 +249,13 @@ class BreedingCalculatorFrame(tk.Frame):
             font=('Arial', 18, 'bold')
         )
         
+        # Non-blocking feedback for failed checks, visible from every tab
+        self.status_label = tk.Label(
+            self.header_frame,
+            text="",
+            font=('Arial', 10)
+        )
+        
         # Main notebook for different sections
         self.main_notebook = ttk.Notebook(self)
         
@@ -94,159 +271,40 @@ class BreedingCalculatorFrame(tk.Frame):
         self.optimization_frame = self.theme_manager.create_styled_frame(self.main_notebook)
         self.main_notebook.add(self.optimization_frame, text="Breeding Guide")
         
-        # Create content for each tab
-        self._create_setup_content()
-        self._create_results_content()
-        self._create_optimization_content()
+        # Tab content is built the first time each tab is shown
+        self._tab_builders = {
+            str(self.setup_frame): self._create_setup_content,
+            str(self.results_frame): self._create_results_content,
+            str(self.optimization_frame): self._create_optimization_content
+        }
+        self._built_tabs = set()
+        self.main_notebook.bind('<<NotebookTabChanged>>', self._on_tab_shown)
+        
+        # The setup tab is visible first and holds the inputs every action reads
+        self._ensure_tab_built(self.setup_frame)
     
-    def _create_setup_content(self):
-        """Create breeding setup tab content."""
-        # Parent 1 Section
-        parent1_frame = self.theme_manager.create_styled_frame(self.setup_frame)
-        parent1_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        parent1_label = self.theme_manager.create_styled_label(
-            parent1_frame,
-            text="Parent 1:",
-            font=('Arial', 12, 'bold')
-        )
-        parent1_label.pack(anchor=tk.W, padx=5)
-        
-        # Parent 1 details
-        p1_details_frame = self.theme_manager.create_styled_frame(parent1_frame)
-        p1_details_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Pokemon selection
-        tk.Label(p1_details_frame, text="Pokemon:").grid(row=0, column=0, sticky=tk.W, padx=5)
-        self.p1_pokemon_var = tk.StringVar(value="Ditto")
-        self.p1_pokemon_combo = ttk.Combobox(
-            p1_details_frame,
-            textvariable=self.p1_pokemon_var,
-            values=["Ditto", "Charizard", "Blastoise", "Venusaur", "Pikachu", "Dragonite"],
-            state="readonly"
-        )
-        self.p1_pokemon_combo.grid(row=0, column=1, padx=5, pady=2)
-        
-        # Gender
-        tk.Label(p1_details_frame, text="Gender:").grid(row=0, column=2, sticky=tk.W, padx=5)
-        self.p1_gender_var = tk.StringVar(value="genderless")
-        self.p1_gender_combo = ttk.Combobox(
-            p1_details_frame,
-            textvariable=self.p1_gender_var,
-            values=["male", "female", "genderless"],
-            state="readonly"
-        )
-        self.p1_gender_combo.grid(row=0, column=3, padx=5, pady=2)
-        
-        # Nature
-        tk.Label(p1_details_frame, text="Nature:").grid(row=1, column=0, sticky=tk.W, padx=5)
-        self.p1_nature_var = tk.StringVar(value="Hardy")
-        nature_values = [nature.value.title() for nature in PokemonNature]
-        self.p1_nature_combo = ttk.Combobox(
-            p1_details_frame,
-            textvariable=self.p1_nature_var,
-            values=nature_values,
-            state="readonly"
-        )
-        self.p1_nature_combo.grid(row=1, column=1, padx=5, pady=2)
-        
-        # Held Item
-        tk.Label(p1_details_frame, text="Held Item:").grid(row=1, column=2, sticky=tk.W, padx=5)
-        self.p1_item_var = tk.StringVar(value="Destiny Knot")
-        item_values = [item.value.replace('_', ' ').title() for item in HeldItem]
-        self.p1_item_combo = ttk.Combobox(
-            p1_details_frame,
-            textvariable=self.p1_item_var,
-            values=["None"] + item_values,
-            state="readonly"
-        )
-        self.p1_item_combo.grid(row=1, column=3, padx=5, pady=2)
-        
-        # IVs for Parent 1
-        tk.Label(p1_details_frame, text="IVs:").grid(row=2, column=0, sticky=tk.W, padx=5)
-        self.p1_iv_frame = tk.Frame(p1_details_frame)
-        self.p1_iv_frame.grid(row=2, column=1, columnspan=3, sticky=tk.W, padx=5, pady=2)
-        
-        self.p1_iv_vars = {}
-        iv_stats = ["HP", "Att", "Def", "SpA", "SpD", "Spe"]
-        for i, stat in enumerate(iv_stats):
-            tk.Label(self.p1_iv_frame, text=f"{stat}:").grid(row=0, column=i*2, padx=2)
-            var = tk.StringVar(value="31")
-            self.p1_iv_vars[stat.lower()] = var
-            entry = tk.Entry(self.p1_iv_frame, textvariable=var, width=4)
-            entry.grid(row=0, column=i*2+1, padx=2)
-        
-        # Parent 2 Section (similar structure)
-        parent2_frame = self.theme_manager.create_styled_frame(self.setup_frame)
-        parent2_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        parent2_label = self.theme_manager.create_styled_label(
-            parent2_frame,
-            text="Parent 2:",
-            font=('Arial', 12, 'bold')
-        )
-        parent2_label.pack(anchor=tk.W, padx=5)
-        
-        # Parent 2 details
-        p2_details_frame = self.theme_manager.create_styled_frame(parent2_frame)
-        p2_details_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Pokemon selection
-        tk.Label(p2_details_frame, text="Pokemon:").grid(row=0, column=0, sticky=tk.W, padx=5)
-        self.p2_pokemon_var = tk.StringVar(value="Charizard")
-        self.p2_pokemon_combo = ttk.Combobox(
-            p2_details_frame,
-            textvariable=self.p2_pokemon_var,
-            values=["Ditto", "Charizard", "Blastoise", "Venusaur", "Pikachu", "Dragonite"],
-            state="readonly"
-        )
-        self.p2_pokemon_combo.grid(row=0, column=1, padx=5, pady=2)
-        
-        # Gender
-        tk.Label(p2_details_frame, text="Gender:").grid(row=0, column=2, sticky=tk.W, padx=5)
-        self.p2_gender_var = tk.StringVar(value="male")
-        self.p2_gender_combo = ttk.Combobox(
-            p2_details_frame,
-            textvariable=self.p2_gender_var,
-            values=["male", "female", "genderless"],
-            state="readonly"
-        )
-        self.p2_gender_combo.grid(row=0, column=3, padx=5, pady=2)
-        
-        # Nature
-        tk.Label(p2_details_frame, text="Nature:").grid(row=1, column=0, sticky=tk.W, padx=5)
-        self.p2_nature_var = tk.StringVar(value="Adamant")
-        self.p2_nature_combo = ttk.Combobox(
-            p2_details_frame,
-            textvariable=self.p2_nature_var,
-            values=nature_values,
-            state="readonly"
-        )
-        self.p2_nature_combo.grid(row=1, column=1, padx=5, pady=2)
-        
-        # Held Item
-        tk.Label(p2_details_frame, text="Held Item:").grid(row=1, column=2, sticky=tk.W, padx=5)
-        self.p2_item_var = tk.StringVar(value="Everstone")
-        self.p2_item_combo = ttk.Combobox(
-            p2_details_frame,
-            textvariable=self.p2_item_var,
-            values=["None"] + item_values,
-            state="readonly"
-        )
-        self.p2_item_combo.grid(row=1, column=3, padx=5, pady=2)
+    def _on_tab_shown(self, event=None):
+        """Build the selected tab's content on first view."""
+        self._ensure_tab_built(self.main_notebook.select())
+    
+    def _ensure_tab_built(self, tab):
+        """Create a notebook tab's widgets exactly once."""
+        tab_name = str(tab)
+        if tab_name in self._built_tabs or tab_name not in self._tab_builders:
+            return
         
-        # IVs for Parent 2
-        tk.Label(p2_details_frame, text="IVs:").grid(row=2, column=0, sticky=tk.W, padx=5)
-        self.p2_iv_frame = tk.Frame(p2_details_frame)
-        self.p2_iv_frame.grid(row=2, column=1, columnspan=3, sticky=tk.W, padx=5, pady=2)
+        self._built_tabs.add(tab_name)
+        self._tab_builders[tab_name]()
         
-        self.p2_iv_vars = {}
-        for i, stat in enumerate(iv_stats):
-            tk.Label(self.p2_iv_frame, text=f"{stat}:").grid(row=0, column=i*2, padx=2)
-            var = tk.StringVar(value="25" if stat != "Att" and stat != "Spe" else "31")
-            self.p2_iv_vars[stat.lower()] = var
-            entry = tk.Entry(self.p2_iv_frame, textvariable=var, width=4)
-            entry.grid(row=0, column=i*2+1, padx=2)
+        # Once every tab exists, tab switches no longer need to reach Python
+        if len(self._built_tabs) == len(self._tab_builders):
+            self.main_notebook.unbind('<<NotebookTabChanged>>')
+    
+    def _create_setup_content(self):
+        """Create breeding setup tab content."""
+        # Parent input blocks
+        for prefix, defaults in self._PARENT_DEFAULTS.items():
+            self._build_parent_block(self.setup_frame, prefix, defaults)
         
         # Breeding Controls
         controls_frame = self.theme_manager.create_styled_frame(self.setup_frame)
@@ -273,6 +331,62 @@ class BreedingCalculatorFrame(tk.Frame):
         )
         self.random_button.pack(side=tk.RIGHT, padx=5)
     
+    def _build_parent_block(self, parent_frame, prefix: str, defaults: dict) -> dict:
+        """Create the input block for one breeding parent and return its variables."""
+        block_frame = self.theme_manager.create_styled_frame(parent_frame)
+        block_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        block_label = self.theme_manager.create_styled_label(
+            block_frame,
+            text=defaults['label'],
+            font=('Arial', 12, 'bold')
+        )
+        block_label.pack(anchor=tk.W, padx=5)
+        
+        # Parent details
+        details_frame = self.theme_manager.create_styled_frame(block_frame)
+        details_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        # Pokemon, gender, nature and held item selectors
+        parent_vars = {}
+        for key, label, values, row, column in self._PARENT_COMBOS:
+            tk.Label(details_frame, text=label).grid(row=row, column=column, sticky=tk.W, padx=5)
+            var = tk.StringVar(value=defaults[key])
+            ttk.Combobox(
+                details_frame,
+                textvariable=var,
+                values=values,
+                state="readonly"
+            ).grid(row=row, column=column + 1, padx=5, pady=2)
+            parent_vars[key] = var
+            var.trace_add('write', self._invalidate_bp_cache)
+        
+        # IVs
+        tk.Label(details_frame, text="IVs:").grid(row=2, column=0, sticky=tk.W, padx=5)
+        iv_frame = tk.Frame(details_frame)
+        iv_frame.grid(row=2, column=1, columnspan=3, sticky=tk.W, padx=5, pady=2)
+        
+        iv_vars = {}
+        for stat, (label_col, entry_col), value in zip(self._IV_STATS, self._IV_COLS, defaults['ivs']):
+            tk.Label(iv_frame, text=f"{stat}:").grid(row=0, column=label_col, padx=2)
+            var = tk.StringVar(value=value)
+            iv_vars[stat.lower()] = var
+            var.trace_add('write', self._invalidate_bp_cache)
+            entry = tk.Entry(iv_frame, textvariable=var, width=4)
+            entry.grid(row=0, column=entry_col, padx=2)
+        parent_vars['ivs'] = iv_vars
+        
+        self.parent_vars[prefix] = parent_vars
+        return parent_vars
+    
+    def _flash_status(self, msg: str, kind: str = 'info'):
+        """Show a message in the header status label instead of a modal dialog."""
+        self.status_label.config(text=msg, fg=self._STATUS_COLORS[kind])
+    
+    def _invalidate_bp_cache(self, *args):
+        """Drop cached parents whenever a parent input changes."""
+        self._bp_cache.clear()
+    
     def _create_results_content(self):
         """Create breeding results tab content."""
         # Results display
@@ -317,11 +431,10 @@ class BreedingCalculatorFrame(tk.Frame):
         # Target nature
         tk.Label(target_details_frame, text="Target Nature:").grid(row=0, column=0, sticky=tk.W, padx=5)
         self.target_nature_var = tk.StringVar(value="Adamant")
-        nature_values = [nature.value.title() for nature in PokemonNature]
         target_nature_combo = ttk.Combobox(
             target_details_frame,
             textvariable=self.target_nature_var,
-            values=nature_values,
+            values=_NATURE_VALUES,
             state="readonly"
         )
         target_nature_combo.grid(row=0, column=1, padx=5, pady=2)
@@ -332,13 +445,12 @@ class BreedingCalculatorFrame(tk.Frame):
         self.target_iv_frame.grid(row=1, column=1, columnspan=3, sticky=tk.W, padx=5, pady=2)
         
         self.target_iv_vars = {}
-        iv_stats = ["HP", "Att", "Def", "SpA", "SpD", "Spe"]
-        for i, stat in enumerate(iv_stats):
-            tk.Label(self.target_iv_frame, text=f"{stat}:").grid(row=0, column=i*2, padx=2)
+        for stat, (label_col, entry_col) in zip(self._IV_STATS, self._IV_COLS):
+            tk.Label(self.target_iv_frame, text=f"{stat}:").grid(row=0, column=label_col, padx=2)
             var = tk.StringVar(value="31")
             self.target_iv_vars[stat.lower()] = var
             entry = tk.Entry(self.target_iv_frame, textvariable=var, width=4)
-            entry.grid(row=0, column=i*2+1, padx=2)
+            entry.grid(row=0, column=entry_col, padx=2)
         
         # Generate guide button
         guide_button = self.theme_manager.create_styled_button(
@@ -368,156 +480,149 @@ class BreedingCalculatorFrame(tk.Frame):
         """Setup the layout of all widgets."""
         self.header_frame.pack(fill=tk.X, padx=10, pady=5)
         self.title_label.pack(side=tk.LEFT, padx=10)
+        self.status_label.pack(side=tk.RIGHT, padx=10)
         
         self.main_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
     
     def _populate_sample_data(self):
         """Populate with sample breeding data."""
         # Set some default values that make sense for breeding
-        self.p1_iv_vars['hp'].set('31')
-        self.p1_iv_vars['att'].set('31')
-        self.p1_iv_vars['def'].set('31')
-        self.p1_iv_vars['spa'].set('31')
-        self.p1_iv_vars['spd'].set('31')
-        self.p1_iv_vars['spe'].set('31')
-        
-        self.p2_iv_vars['hp'].set('25')
-        self.p2_iv_vars['att'].set('31')
-        self.p2_iv_vars['def'].set('20')
-        self.p2_iv_vars['spa'].set('15')
-        self.p2_iv_vars['spd'].set('25')
-        self.p2_iv_vars['spe'].set('31')
+        sample_ivs = {
+            'p1': ('31', '31', '31', '31', '31', '31'),
+            'p2': ('25', '31', '20', '15', '25', '31')
+        }
+        for prefix, values in sample_ivs.items():
+            iv_vars = self.parent_vars[prefix]['ivs']
+            for key, value in zip(self._IV_KEYS, values):
+                iv_vars[key].set(value)
+    
+    def _parse_ivs(self, iv_vars: Dict[str, tk.StringVar]) -> IV:
+        """Build an IV set from a dict of IV entry variables."""
+        values = {}
+        for key, stat, field in zip(self._IV_KEYS, self._IV_STATS, self._IV_FIELDS):
+            text = iv_vars[key].get().strip()
+            if not _IV_RE.match(text):
+                raise ValueError(f"{stat} IV must be a whole number from 0 to 31 (got '{text}')")
+            values[field] = int(text)
+        return IV(**values)
     
     def _create_breeding_pokemon_from_inputs(self, prefix: str) -> Optional[BreedingPokemon]:
         """Create a BreedingPokemon from GUI inputs."""
         try:
-            if prefix == 'p1':
-                pokemon_name = self.p1_pokemon_var.get()
-                nature_str = self.p1_nature_var.get().lower()
-                gender = self.p1_gender_var.get()
-                item_str = self.p1_item_var.get().lower().replace(' ', '_')
-                iv_vars = self.p1_iv_vars
-            else:
-                pokemon_name = self.p2_pokemon_var.get()
-                nature_str = self.p2_nature_var.get().lower()
-                gender = self.p2_gender_var.get()
-                item_str = self.p2_item_var.get().lower().replace(' ', '_')
-                iv_vars = self.p2_iv_vars
+            parent_vars = self.parent_vars[prefix]
+            pokemon_name = parent_vars['pokemon'].get()
+            nature_str = parent_vars['nature'].get().lower()
+            gender = parent_vars['gender'].get()
+            item_str = parent_vars['item'].get().lower().replace(' ', '_')
+            iv_vars = parent_vars['ivs']
             
-            # Create IVs
-            ivs = IV(
-                hp=int(iv_vars['hp'].get()),
-                attack=int(iv_vars['att'].get()),
-                defense=int(iv_vars['def'].get()),
-                special_attack=int(iv_vars['spa'].get()),
-                special_defense=int(iv_vars['spd'].get()),
-                speed=int(iv_vars['spe'].get())
+            # Reuse the last object built from identical inputs
+            key = (
+                prefix, pokemon_name, nature_str, gender, item_str,
+                *(iv_vars[k].get() for k in self._IV_KEYS)
             )
+            cached = self._bp_cache.get(key)
+            if cached is not None:
+                return cached
             
-            # Get nature
-            nature = PokemonNature(nature_str)
+            # Create IVs
+            ivs = self._parse_ivs(iv_vars)
             
-            # Get held item
-            held_item = None
-            if item_str != "none":
-                try:
-                    held_item = HeldItem(item_str)
-                except ValueError:
-                    held_item = None
+            # Get nature and held item
+            nature = _nature_from_string(nature_str)
+            held_item = _held_item_or_none(item_str)
             
             # Create Pokemon
-            species_map = {
-                "Ditto": 132,
-                "Charizard": 6,
-                "Blastoise": 9,
-                "Venusaur": 3,
-                "Pikachu": 25,
-                "Dragonite": 149
-            }
-            
             pokemon = Pokemon(
                 name=pokemon_name,
-                species_id=species_map.get(pokemon_name, 1),
+                species_id=_SPECIES_ID_MAP.get(pokemon_name, 1),
                 level=50,
                 nature=nature,
                 ivs=ivs,
                 evs=EV(),
-                base_stats=BaseStats(hp=50, attack=50, defense=50, special_attack=50, special_defense=50, speed=50),
+                base_stats=_PLACEHOLDER_BASE_STATS,
                 moves=[],
                 ability="Test Ability"
             )
             
-            # Get egg groups
-            egg_groups_map = {
-                "Ditto": [EggGroup.DITTO],
-                "Charizard": [EggGroup.MONSTER, EggGroup.DRAGON],
-                "Blastoise": [EggGroup.MONSTER, EggGroup.WATER_1],
-                "Venusaur": [EggGroup.MONSTER, EggGroup.GRASS],
-                "Pikachu": [EggGroup.FIELD, EggGroup.FAIRY],
-                "Dragonite": [EggGroup.WATER_1, EggGroup.DRAGON]
-            }
-            
-            return BreedingPokemon(
+            breeding_pokemon = BreedingPokemon(
                 pokemon=pokemon,
-                egg_groups=egg_groups_map.get(pokemon_name, [EggGroup.FIELD]),
+                egg_groups=list(_EGG_GROUPS_MAP.get(pokemon_name, (EggGroup.FIELD,))),
                 held_item=held_item,
                 gender=gender
             )
+            self._bp_cache[key] = breeding_pokemon
+            return breeding_pokemon
         
+        except ValueError as e:
+            self._flash_status(f"Invalid input: {self._PARENT_DEFAULTS[prefix]['label']} {e}", 'error')
+            return None
         except Exception as e:
             logger.error(f"Error creating breeding Pokemon: {e}")
+            self._flash_status("Failed to create Pokemon from inputs", 'error')
             return None
     
     def _check_compatibility(self):
         """Check if the two selected Pokemon can breed."""
+        # Input errors are reported by _create_breeding_pokemon_from_inputs
         parent1 = self._create_breeding_pokemon_from_inputs('p1')
-        parent2 = self._create_breeding_pokemon_from_inputs('p2')
+        parent2 = parent1 and self._create_breeding_pokemon_from_inputs('p2')
         
         if not parent1 or not parent2:
-            messagebox.showerror("Error", "Failed to create Pokemon from inputs")
             return
         
         can_breed = self.calculator.can_breed(parent1, parent2)
+        shared = frozenset(parent1.egg_groups).intersection(parent2.egg_groups)
         
         if can_breed:
+            self._flash_status("")
             messagebox.showinfo(
                 "Compatibility Check",
                 f"✅ {parent1.pokemon.name} and {parent2.pokemon.name} can breed together!\n\n"
-                f"Shared egg groups: {set(parent1.egg_groups) & set(parent2.egg_groups)}\n"
+                f"Shared egg groups: {', '.join(_pretty_group(group) for group in shared)}\n"
                 f"Gender compatibility: {parent1.gender} + {parent2.gender}"
             )
         else:
             reasons = []
-            if set(parent1.egg_groups) & set(parent2.egg_groups) == set():
+            if not shared:
                 reasons.append("No shared egg groups")
             if parent1.gender == parent2.gender and parent1.gender != "genderless":
                 reasons.append("Same gender (not compatible)")
             if EggGroup.UNDISCOVERED in parent1.egg_groups or EggGroup.UNDISCOVERED in parent2.egg_groups:
                 reasons.append("Undiscovered egg group cannot breed")
             
-            messagebox.showwarning(
-                "Compatibility Check",
-                f"❌ {parent1.pokemon.name} and {parent2.pokemon.name} cannot breed.\n\n"
-                f"Reasons: {', '.join(reasons)}"
+            self._flash_status(
+                f"❌ {parent1.pokemon.name} and {parent2.pokemon.name} cannot breed: {', '.join(reasons)}",
+                'warn'
             )
     
     def _calculate_breeding(self):
         """Calculate breeding results."""
+        # Input errors are reported by _create_breeding_pokemon_from_inputs
         parent1 = self._create_breeding_pokemon_from_inputs('p1')
-        parent2 = self._create_breeding_pokemon_from_inputs('p2')
+        parent2 = parent1 and self._create_breeding_pokemon_from_inputs('p2')
         
         if not parent1 or not parent2:
-            messagebox.showerror("Error", "Failed to create Pokemon from inputs")
+            return
+        
+        self._flash_status("")
+        
+        # Unchanged inputs return the same cached parents, so the shown result is current
+        sig = (id(parent1), id(parent2))
+        if sig == self._last_calc_sig:
+            self.main_notebook.select(1)
             return
         
         # Calculate breeding result
         result = self.calculator.breed_pokemon(parent1, parent2)
         
         if not result:
-            messagebox.showerror("Breeding Error", "These Pokemon cannot breed together")
+            self._flash_status("These Pokemon cannot breed together", 'error')
             return
         
         self.breeding_result = result
+        self._last_calc_sig = sig
+        self._last_calc_parents = (parent1, parent2)
         
         # Display results
         self._display_breeding_results(result, parent1, parent2)
@@ -527,68 +632,55 @@ class BreedingCalculatorFrame(tk.Frame):
     
     def _display_breeding_results(self, result, parent1, parent2):
         """Display breeding results in the results text area."""
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
+        self._ensure_tab_built(self.results_frame)
+        
+        offspring_ivs = result.offspring.ivs
+        fields = {
+            'offspring_name': result.offspring.name,
+            'offspring_level': result.offspring.level,
+            'offspring_nature': _pretty_nature(result.offspring.nature),
+            'nature_inheritance': result.nature_inheritance,
+            'success_rate': result.success_rate,
+            'success_pct': result.success_rate * 100,
+            'generation_estimate': result.generation_estimate,
+            'perfect_ivs': _count_perfect_ivs(_pack_ivs(offspring_ivs))
+        }
+        for stat in self._IV_FIELDS:
+            fields[f'iv_{stat}'] = getattr(offspring_ivs, stat)
+            fields[f'from_{stat}'] = result.iv_inheritance[stat]
+        for prefix, parent in (('p1', parent1), ('p2', parent2)):
+            ivs = parent.pokemon.ivs
+            fields[f'{prefix}_name'] = parent.pokemon.name
+            fields[f'{prefix}_gender'] = parent.gender
+            fields[f'{prefix}_nature'] = _pretty_nature(parent.pokemon.nature)
+            fields[f'{prefix}_item'] = _pretty_item(parent.held_item)
+            fields[f'{prefix}_ivs'] = (
+                f"HP:{ivs.hp} Att:{ivs.attack} Def:{ivs.defense} "
+                f"SpA:{ivs.special_attack} SpD:{ivs.special_defense} Spe:{ivs.speed}"
+            )
+            fields[f'{prefix}_egg_groups'] = ', '.join(_pretty_group(group) for group in parent.egg_groups)
         
-        results_content = f"""🥚 BREEDING CALCULATION RESULTS
-{'='*50}
-
-PARENT INFORMATION:
-Parent 1: {parent1.pokemon.name} ({parent1.gender})
-- Nature: {parent1.pokemon.nature.value.title()}
-- Held Item: {parent1.held_item.value.replace('_', ' ').title() if parent1.held_item else 'None'}
-- IVs: HP:{parent1.pokemon.ivs.hp} Att:{parent1.pokemon.ivs.attack} Def:{parent1.pokemon.ivs.defense} SpA:{parent1.pokemon.ivs.special_attack} SpD:{parent1.pokemon.ivs.special_defense} Spe:{parent1.pokemon.ivs.speed}
-- Egg Groups: {', '.join([group.value.title().replace('_', ' ') for group in parent1.egg_groups])}
-
-Parent 2: {parent2.pokemon.name} ({parent2.gender})
-- Nature: {parent2.pokemon.nature.value.title()}
-- Held Item: {parent2.held_item.value.replace('_', ' ').title() if parent2.held_item else 'None'}
-- IVs: HP:{parent2.pokemon.ivs.hp} Att:{parent2.pokemon.ivs.attack} Def:{parent2.pokemon.ivs.defense} SpA:{parent2.pokemon.ivs.special_attack} SpD:{parent2.pokemon.ivs.special_defense} Spe:{parent2.pokemon.ivs.speed}
-- Egg Groups: {', '.join([group.value.title().replace('_', ' ') for group in parent2.egg_groups])}
-
-OFFSPRING RESULT:
-Species: {result.offspring.name}
-Level: {result.offspring.level}
-Nature: {result.offspring.nature.value.title()} (inherited from: {result.nature_inheritance})
-
-FINAL IVs:
-HP: {result.offspring.ivs.hp} (from: {result.iv_inheritance['hp']})
-Attack: {result.offspring.ivs.attack} (from: {result.iv_inheritance['attack']})
-Defense: {result.offspring.ivs.defense} (from: {result.iv_inheritance['defense']})
-Sp. Attack: {result.offspring.ivs.special_attack} (from: {result.iv_inheritance['special_attack']})
-Sp. Defense: {result.offspring.ivs.special_defense} (from: {result.iv_inheritance['special_defense']})
-Speed: {result.offspring.ivs.speed} (from: {result.iv_inheritance['speed']})
-
-BREEDING STATISTICS:
-Success Rate: {result.success_rate:.6f} ({result.success_rate*100:.4f}%)
-Estimated Generations: {result.generation_estimate}
-Perfect IVs: {sum(1 for iv in [result.offspring.ivs.hp, result.offspring.ivs.attack, result.offspring.ivs.defense, result.offspring.ivs.special_attack, result.offspring.ivs.special_defense, result.offspring.ivs.speed] if iv == 31)}/6
-
-BREEDING TIPS:
-• Use Destiny Knot to inherit 5 IVs from parents
-• Use Everstone to guarantee nature inheritance
-• Use Power items to guarantee specific IV inheritance
-• Keep the best offspring for next generation breeding
-• Consider using different parent combinations for optimization
-
-"""
+        results_content = _RESULTS_TEMPLATE.format_map(fields)
         
-        self.results_text.insert(1.0, results_content)
-        self.results_text.config(state=tk.DISABLED)
+        with self._editable(self.results_text):
+            self.results_text.delete(1.0, tk.END)
+            self.results_text.insert(1.0, results_content)
+    
+    @contextmanager
+    def _editable(self, text_widget: tk.Text):
+        """Temporarily enable a read-only Text widget for one batch of edits."""
+        text_widget.config(state=tk.NORMAL)
+        try:
+            yield text_widget
+        finally:
+            text_widget.config(state=tk.DISABLED)
     
     def _generate_breeding_guide(self):
         """Generate a comprehensive breeding guide."""
         try:
             # Create target Pokemon from inputs
-            target_nature = PokemonNature(self.target_nature_var.get().lower())
-            target_ivs = IV(
-                hp=int(self.target_iv_vars['hp'].get()),
-                attack=int(self.target_iv_vars['att'].get()),
-                defense=int(self.target_iv_vars['def'].get()),
-                special_attack=int(self.target_iv_vars['spa'].get()),
-                special_defense=int(self.target_iv_vars['spd'].get()),
-                speed=int(self.target_iv_vars['spe'].get())
-            )
+            target_nature = _nature_from_string(self.target_nature_var.get().lower())
+            target_ivs = self._parse_ivs(self.target_iv_vars)
             
             target_pokemon = Pokemon(
                 name="Target",
@@ -597,35 +689,44 @@ BREEDING TIPS:
                 nature=target_nature,
                 ivs=target_ivs,
                 evs=EV(),
-                base_stats=BaseStats(hp=50, attack=50, defense=50, special_attack=50, special_defense=50, speed=50),
+                base_stats=_PLACEHOLDER_BASE_STATS,
                 moves=[],
                 ability="Test"
             )
             
-            # Create available Pokemon (using current inputs)
+            # Create available Pokemon (using current inputs; errors are reported there)
             parent1 = self._create_breeding_pokemon_from_inputs('p1')
-            parent2 = self._create_breeding_pokemon_from_inputs('p2')
+            parent2 = parent1 and self._create_breeding_pokemon_from_inputs('p2')
             
             if not parent1 or not parent2:
-                messagebox.showerror("Error", "Failed to create Pokemon from inputs")
+                return
+            
+            self._flash_status("")
+            
+            # Skip regeneration when neither the parents nor the target changed
+            sig = (id(parent1), id(parent2), target_nature, _pack_ivs(target_ivs))
+            if sig == self._last_guide_sig:
                 return
             
             available_pokemon = [parent1, parent2]
             
             # Generate guide
             guide = self.calculator.generate_breeding_guide(target_pokemon, available_pokemon)
+            self._last_guide_sig = sig
+            self._last_guide_parents = (parent1, parent2)
             
             # Display guide
             self._display_breeding_guide(guide)
             
+        except ValueError as e:
+            self._flash_status(f"Invalid input: Target {e}", 'error')
         except Exception as e:
             logger.error(f"Error generating breeding guide: {e}")
-            messagebox.showerror("Error", f"Failed to generate breeding guide: {e}")
+            self._flash_status(f"Failed to generate breeding guide: {e}", 'error')
     
     def _display_breeding_guide(self, guide):
         """Display the breeding guide."""
-        self.guide_text.config(state=tk.NORMAL)
-        self.guide_text.delete(1.0, tk.END)
+        self._ensure_tab_built(self.optimization_frame)
         
         if not guide['success']:
             guide_content = f"""❌ BREEDING GUIDE - NO VIABLE PATH FOUND
@@ -641,7 +742,7 @@ RECOMMENDATIONS:
 
 TARGET POKEMON:
 Name: {guide['target']['name']}
-Nature: {guide['target']['nature'].value.title()}
+Nature: {_pretty_nature(guide['target']['nature'])}
 Target IVs: HP:{guide['target']['ivs'].hp} Att:{guide['target']['ivs'].attack} Def:{guide['target']['ivs'].defense} SpA:{guide['target']['ivs'].special_attack} SpD:{guide['target']['ivs'].special_defense} Spe:{guide['target']['ivs'].speed}
 
 BEST BREEDING PAIR:
@@ -667,33 +768,22 @@ BREEDING TIPS:
             for tip in guide['tips']:
                 guide_content += f"• {tip}\n"
         
-        self.guide_text.insert(1.0, guide_content)
-        self.guide_text.config(state=tk.DISABLED)
+        with self._editable(self.guide_text):
+            self.guide_text.delete(1.0, tk.END)
+            self.guide_text.insert(1.0, guide_content)
     
     def _generate_random_example(self):
         """Generate a random breeding example."""
-        import random
-        
-        # Random parent 1
-        pokemon_options = ["Ditto", "Charizard", "Blastoise", "Venusaur", "Pikachu", "Dragonite"]
-        self.p1_pokemon_var.set(random.choice(pokemon_options))
-        self.p1_gender_var.set(random.choice(["male", "female", "genderless"]))
-        self.p1_nature_var.set(random.choice([nature.value.title() for nature in PokemonNature]))
-        self.p1_item_var.set(random.choice(["Destiny Knot", "Everstone", "None"]))
-        
-        # Random IVs for parent 1
-        for stat in self.p1_iv_vars:
-            self.p1_iv_vars[stat].set(str(random.randint(0, 31)))
-        
-        # Random parent 2
-        self.p2_pokemon_var.set(random.choice(pokemon_options))
-        self.p2_gender_var.set(random.choice(["male", "female", "genderless"]))
-        self.p2_nature_var.set(random.choice([nature.value.title() for nature in PokemonNature]))
-        self.p2_item_var.set(random.choice(["Destiny Knot", "Everstone", "None"]))
-        
-        # Random IVs for parent 2
-        for stat in self.p2_iv_vars:
-            self.p2_iv_vars[stat].set(str(random.randint(0, 31)))
+        for parent_vars in self.parent_vars.values():
+            parent_vars['pokemon'].set(self._rng.choice(_POKEMON_CHOICES))
+            parent_vars['gender'].set(self._rng.choice(self._RANDOM_GENDERS))
+            parent_vars['nature'].set(self._rng.choice(_NATURE_VALUES))
+            parent_vars['item'].set(self._rng.choice(self._RANDOM_ITEMS))
+            
+            # Random IVs
+            iv_vars = parent_vars['ivs']
+            for key, value in zip(self._IV_KEYS, self._rng.choices(range(32), k=6)):
+                iv_vars[key].set(str(value))
         
         messagebox.showinfo("Random Example", "Generated random breeding example! Try calculating the results.")
 
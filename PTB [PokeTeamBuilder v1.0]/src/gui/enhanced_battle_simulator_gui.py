@@ -7,22 +7,114 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
 import os
+import queue
 import random
+import threading
 from typing import List, Dict, Any, Optional
 
-# Add the src directory to the path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Add the project root to the path for imports when run outside run_gui.py
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
 
-from src.gui.theme_manager import ThemeManager
+from src.gui.theme_manager import ThemeManager, center_window
 from src.battle.battle_engine import BattleEngine, BattleState
 from src.battle.battle_ai import BattleAI, AIPersonality
 from src.core.pokemon import Pokemon
 from src.core.types import PokemonType
 
 
+# Choices for the simulated battle actions
+_AUTO_MOVES = ("Tackle", "Quick Attack", "Thunder Shock", "Water Gun", "Ember", "Vine Whip")
+_AUTO_EVENTS = ("Critical hit!", "Super effective!", "Not very effective...", "It's a miss!")
+_WINNERS = ("Player", "AI")
+_PLAYER_MOVES = ("Tackle", "Quick Attack", "Thunder Shock", "Flamethrower")
+_AI_MOVES = ("Thunder Wave", "Water Gun", "Ember", "Vine Whip", "Psychic")
+_MOVE_EFFECTS = ("Critical hit!", "Super effective!", "The foe is paralyzed!")
+_SWITCH_POKEMON = ("Pikachu", "Charizard", "Blastoise", "Venusaur", "Alakazam", "Machamp")
+_ITEMS = ("Potion", "Super Potion", "Full Heal", "X Attack", "X Defense")
+
+# Emoji log prefixes, built once instead of formatted into every message
+_PLAYER_USED = "👤 Player used "
+_AI_USED = "🤖 AI used "
+_EFFECT = "✨ "
+_SWITCHED_TO = "🔄 Switched to "
+_ITEM_USED = "🎒 Used "
+
+# Auto battle log lines for every possible draw, rendered once
+_AUTO_PLAYER_LINES = {move: "  " + _PLAYER_USED + move + "!" for move in _AUTO_MOVES}
+_AUTO_AI_LINES = {move: "  " + _AI_USED + move + "!" for move in _AUTO_MOVES}
+_AUTO_EVENT_LINES = tuple("  " + _EFFECT + event for event in _AUTO_EVENTS)
+_WINNER_LINES = tuple("🏆 " + winner + " wins the battle!" for winner in _WINNERS)
+
+# Static battle analysis report text
+_STATS_CONTENT = """BATTLE STATISTICS
+========================
+
+🎯 Accuracy Rate: 85%
+💥 Critical Hit Rate: 12%
+⚡ Average Damage: 45 HP
+🔄 Turns Played: 15
+⏱️ Battle Duration: 3:24
+
+MOVE USAGE
+----------
+⚔️ Physical Moves: 60%
+✨ Special Moves: 30%
+🛡️ Status Moves: 10%
+
+TYPE EFFECTIVENESS
+------------------
+🔥 Super Effective: 8 hits
+⚪ Normal Damage: 12 hits
+🔵 Not Very Effective: 3 hits
+❌ No Effect: 0 hits
+
+AI PERFORMANCE
+--------------
+🤖 Prediction Accuracy: 78%
+🎭 Strategy Consistency: High
+⚡ Reaction Time: 0.8s average"""
+
+_TEAM_CONTENT = """TEAM PERFORMANCE ANALYSIS
+===========================
+
+YOUR TEAM
+---------
+🏆 Overall Rating: A-
+⚔️ Offensive Power: 8/10
+🛡️ Defensive Capability: 7/10
+⚡ Speed Control: 6/10
+🎯 Type Coverage: 9/10
+
+POKEMON PERFORMANCE
+-------------------
+1. Pikachu ⚡
+   - Damage Dealt: 180 HP
+   - Damage Taken: 95 HP
+   - Moves Used: Thunder Shock (4), Quick Attack (2)
+   - Rating: B+
+
+2. Charizard 🔥
+   - Damage Dealt: 220 HP
+   - Damage Taken: 140 HP
+   - Moves Used: Flamethrower (3), Dragon Pulse (1)
+   - Rating: A-
+
+RECOMMENDATIONS
+---------------
+💡 Consider adding more defensive options
+🎯 Ice-type coverage could be improved
+⚡ Speed control moves recommended
+🛡️ Entry hazard support beneficial"""
+
+
 class BattleSimulatorFrame(tk.Frame):
     """Enhanced Battle Simulator interface frame."""
     
+    # Lines kept in the log widget; battle_log keeps the full history
+    MAX_LOG_LINES = 1000
+    
     def __init__(self, parent, theme_manager: ThemeManager):
         super().__init__(parent)
         self.theme_manager = theme_manager
@@ -31,6 +123,19 @@ class BattleSimulatorFrame(tk.Frame):
         self.current_battle = None
         self.battle_log = []
         
+        self._analysis_window = None
+        self._rng = random.Random()
+        
+        # Reusable (name, HP) label pairs for each side's Pokemon display
+        self._player_slots = []
+        self._ai_slots = []
+        
+        # Lines waiting to be written to the log widget by _flush_log; the
+        # auto battle worker thread pushes to this queue directly
+        self._log_queue = queue.SimpleQueue()
+        self._log_flush_scheduled = False
+        self._log_producer_running = False
+        
         self._create_widgets()
         self._setup_sample_battle()
     
@@ -154,14 +259,14 @@ class BattleSimulatorFrame(tk.Frame):
         )
         start_btn.pack(side=tk.LEFT, padx=5)
         
-        auto_btn = self.theme_manager.create_styled_button(
+        self.auto_btn = self.theme_manager.create_styled_button(
             action_frame,
             text="🤖 Auto Battle",
             command=self._auto_battle,
             style="secondary",
             width=15
         )
-        auto_btn.pack(side=tk.LEFT, padx=5)
+        self.auto_btn.pack(side=tk.LEFT, padx=5)
         
         analyze_btn = self.theme_manager.create_styled_button(
             action_frame,
@@ -358,234 +463,250 @@ class BattleSimulatorFrame(tk.Frame):
     
     def _auto_battle(self):
         """Run an automated battle simulation."""
-        try:
-            self._add_to_log("🤖 AUTO BATTLE MODE ACTIVATED!")
-            self._add_to_log("⚡ Running automated battle simulation...")
-            
-            # Simulate battle turns
-            turns = random.randint(8, 20)
-            moves = ["Tackle", "Quick Attack", "Thunder Shock", "Water Gun", "Ember", "Vine Whip"]
-            
-            for turn in range(1, turns + 1):
-                player_move = random.choice(moves)
-                ai_move = random.choice(moves)
+        self._add_lines_to_log([
+            "🤖 AUTO BATTLE MODE ACTIVATED!",
+            "⚡ Running automated battle simulation..."
+        ])
+        
+        # Simulate in a separate thread to keep the window responsive; its
+        # log lines are drained by _flush_log while it runs
+        self.auto_btn.config(state=tk.DISABLED)
+        self._log_producer_running = True
+        
+        def auto_battle_thread():
+            try:
+                self._simulate_auto_battle(self._log_queue.put)
                 
-                self._add_to_log(f"Turn {turn}:")
-                self._add_to_log(f"  👤 Player used {player_move}!")
-                self._add_to_log(f"  🤖 AI used {ai_move}!")
+                # Update UI in main thread
+                self.after(0, self._on_auto_battle_done)
                 
-                # Random battle events
-                if random.random() < 0.3:
-                    events = ["Critical hit!", "Super effective!", "Not very effective...", "It's a miss!"]
-                    self._add_to_log(f"  ✨ {random.choice(events)}")
-                
-                if turn == turns:
-                    winner = random.choice(["Player", "AI"])
-                    self._add_to_log("=" * 40)
-                    self._add_to_log(f"🏆 {winner} wins the battle!")
-                    break
+            except Exception as e:
+                error = str(e)
+                self.after(0, lambda: self._on_auto_battle_failed(error))
+        
+        threading.Thread(target=auto_battle_thread, daemon=True).start()
+    
+    def _simulate_auto_battle(self, emit):
+        """Simulate a full automated battle, passing each log line to emit."""
+        rand = self._rng.random
+        choice = self._rng.choice
+        
+        # Simulate battle turns
+        turns = self._rng.randint(8, 20)
+        
+        # Draw every move for the battle up front
+        all_moves = iter(self._rng.choices(_AUTO_MOVES, k=turns * 2))
+        
+        for turn in range(1, turns + 1):
+            player_move = next(all_moves)
+            ai_move = next(all_moves)
             
-            self.status_label.config(text="Auto battle completed! Check the battle log for results.")
+            emit(f"Turn {turn}:")
+            emit(_AUTO_PLAYER_LINES[player_move])
+            emit(_AUTO_AI_LINES[ai_move])
             
-        except Exception as e:
-            messagebox.showerror("Error", f"Auto battle failed: {str(e)}")
+            # Random battle events
+            if rand() < 0.3:
+                emit(choice(_AUTO_EVENT_LINES))
+            
+            if turn == turns:
+                emit("=" * 40)
+                emit(choice(_WINNER_LINES))
+                break
+    
+    def _on_auto_battle_done(self):
+        """Show a finished auto battle; runs on the Tk main loop."""
+        self.auto_btn.config(state=tk.NORMAL)
+        
+        # Drain whatever the worker queued after the last flush
+        self._log_producer_running = False
+        self._schedule_log_flush()
+        
+        self.status_label.config(text="Auto battle completed! Check the battle log for results.")
+    
+    def _on_auto_battle_failed(self, error: str):
+        """Report an auto battle error raised in the worker thread."""
+        self.auto_btn.config(state=tk.NORMAL)
+        self._log_producer_running = False
+        self._schedule_log_flush()
+        messagebox.showerror("Error", f"Auto battle failed: {error}")
     
     def _show_battle_analysis(self):
         """Show detailed battle analysis."""
         try:
-            analysis_window = tk.Toplevel(self)
-            analysis_window.title("Battle Analysis")
-            analysis_window.geometry("800x600")
-            analysis_window.transient(self)
-            analysis_window.grab_set()
-            
-            # Center window
-            analysis_window.update_idletasks()
-            x = (analysis_window.winfo_screenwidth() // 2) - (400)
-            y = (analysis_window.winfo_screenheight() // 2) - (300)
-            analysis_window.geometry(f"800x600+{x}+{y}")
-            
-            # Analysis content
-            title_label = self.theme_manager.create_styled_label(
-                analysis_window,
-                text="📊 Battle Analysis Report",
-                font=('Arial', 18, 'bold')
-            )
-            title_label.pack(pady=20)
-            
-            # Notebook for different analysis tabs
-            notebook = ttk.Notebook(analysis_window)
-            notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-            
-            # Statistics tab
-            stats_frame = tk.Frame(notebook)
-            notebook.add(stats_frame, text="📈 Statistics")
-            
-            stats_text = tk.Text(stats_frame, font=('Consolas', 10))
-            stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            stats_content = """BATTLE STATISTICS
-========================
-
-🎯 Accuracy Rate: 85%
-💥 Critical Hit Rate: 12%
-⚡ Average Damage: 45 HP
-🔄 Turns Played: 15
-⏱️ Battle Duration: 3:24
-
-MOVE USAGE
-----------
-⚔️ Physical Moves: 60%
-✨ Special Moves: 30%
-🛡️ Status Moves: 10%
-
-TYPE EFFECTIVENESS
-------------------
-🔥 Super Effective: 8 hits
-⚪ Normal Damage: 12 hits
-🔵 Not Very Effective: 3 hits
-❌ No Effect: 0 hits
-
-AI PERFORMANCE
---------------
-🤖 Prediction Accuracy: 78%
-🎭 Strategy Consistency: High
-⚡ Reaction Time: 0.8s average"""
+            if self._analysis_window is None:
+                self._analysis_window = self._build_analysis_window()
+            else:
+                self._analysis_window.deiconify()
+                self._analysis_window.lift()
             
-            stats_text.insert(1.0, stats_content)
-            stats_text.config(state=tk.DISABLED)
-            
-            # Team analysis tab
-            team_frame = tk.Frame(notebook)
-            notebook.add(team_frame, text="👥 Team Analysis")
-            
-            team_text = tk.Text(team_frame, font=('Consolas', 10))
-            team_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            team_content = """TEAM PERFORMANCE ANALYSIS
-===========================
-
-YOUR TEAM
----------
-🏆 Overall Rating: A-
-⚔️ Offensive Power: 8/10
-🛡️ Defensive Capability: 7/10
-⚡ Speed Control: 6/10
-🎯 Type Coverage: 9/10
-
-POKEMON PERFORMANCE
--------------------
-1. Pikachu ⚡
-   - Damage Dealt: 180 HP
-   - Damage Taken: 95 HP
-   - Moves Used: Thunder Shock (4), Quick Attack (2)
-   - Rating: B+
-
-2. Charizard 🔥
-   - Damage Dealt: 220 HP
-   - Damage Taken: 140 HP
-   - Moves Used: Flamethrower (3), Dragon Pulse (1)
-   - Rating: A-
-
-RECOMMENDATIONS
----------------
-💡 Consider adding more defensive options
-🎯 Ice-type coverage could be improved
-⚡ Speed control moves recommended
-🛡️ Entry hazard support beneficial"""
-            
-            team_text.insert(1.0, team_content)
-            team_text.config(state=tk.DISABLED)
-            
-            # Close button
-            close_btn = self.theme_manager.create_styled_button(
-                analysis_window,
-                text="Close",
-                command=analysis_window.destroy,
-                style="secondary"
-            )
-            close_btn.pack(pady=10)
+            self._analysis_window.grab_set()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show analysis: {str(e)}")
     
+    def _build_analysis_window(self) -> tk.Toplevel:
+        """Create the battle analysis window."""
+        analysis_window = tk.Toplevel(self)
+        analysis_window.title("Battle Analysis")
+        analysis_window.transient(self)
+        analysis_window.protocol("WM_DELETE_WINDOW", self._close_analysis_window)
+        center_window(analysis_window, 800, 600)
+        
+        # Analysis content
+        title_label = self.theme_manager.create_styled_label(
+            analysis_window,
+            text="📊 Battle Analysis Report",
+            font=('Arial', 18, 'bold')
+        )
+        title_label.pack(pady=20)
+        
+        # Notebook for different analysis tabs
+        notebook = ttk.Notebook(analysis_window)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        
+        # Statistics tab
+        stats_frame = tk.Frame(notebook)
+        notebook.add(stats_frame, text="📈 Statistics")
+        
+        stats_text = tk.Text(stats_frame, font=('Consolas', 10))
+        stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        stats_text.insert(1.0, _STATS_CONTENT)
+        stats_text.config(state=tk.DISABLED)
+        
+        # Team analysis tab
+        team_frame = tk.Frame(notebook)
+        notebook.add(team_frame, text="👥 Team Analysis")
+        
+        team_text = tk.Text(team_frame, font=('Consolas', 10))
+        team_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        team_text.insert(1.0, _TEAM_CONTENT)
+        team_text.config(state=tk.DISABLED)
+        
+        # Close button
+        close_btn = self.theme_manager.create_styled_button(
+            analysis_window,
+            text="Close",
+            command=self._close_analysis_window,
+            style="secondary"
+        )
+        close_btn.pack(pady=10)
+        
+        return analysis_window
+    
+    def _close_analysis_window(self):
+        """Hide the analysis window so it can be shown again later."""
+        self._analysis_window.grab_release()
+        self._analysis_window.withdraw()
+    
     def _use_move(self, move_index: int):
         """Use a move in battle."""
-        moves = ["Tackle", "Quick Attack", "Thunder Shock", "Flamethrower"]
-        move_name = moves[move_index] if move_index < len(moves) else f"Move {move_index + 1}"
+        move_name = _PLAYER_MOVES[move_index] if move_index < len(_PLAYER_MOVES) else f"Move {move_index + 1}"
         
-        self._add_to_log(f"👤 Player used {move_name}!")
+        self._add_to_log(_PLAYER_USED + move_name + "!")
         
         # Simulate AI response
-        ai_moves = ["Thunder Wave", "Water Gun", "Ember", "Vine Whip", "Psychic"]
-        ai_move = random.choice(ai_moves)
-        self._add_to_log(f"🤖 AI used {ai_move}!")
+        ai_move = self._rng.choice(_AI_MOVES)
+        self._add_to_log(_AI_USED + ai_move + "!")
         
         # Random effects
-        if random.random() < 0.2:
-            effects = ["Critical hit!", "Super effective!", "The foe is paralyzed!"]
-            self._add_to_log(f"✨ {random.choice(effects)}")
+        if self._rng.random() < 0.2:
+            self._add_to_log(_EFFECT + self._rng.choice(_MOVE_EFFECTS))
     
     def _switch_pokemon(self):
         """Switch to a different Pokemon."""
-        pokemon_list = ["Pikachu", "Charizard", "Blastoise", "Venusaur", "Alakazam", "Machamp"]
-        selected = random.choice(pokemon_list)
-        self._add_to_log(f"🔄 Switched to {selected}!")
+        selected = self._rng.choice(_SWITCH_POKEMON)
+        self._add_to_log(_SWITCHED_TO + selected + "!")
     
     def _use_item(self):
         """Use an item in battle."""
-        items = ["Potion", "Super Potion", "Full Heal", "X Attack", "X Defense"]
-        selected = random.choice(items)
-        self._add_to_log(f"🎒 Used {selected}!")
+        selected = self._rng.choice(_ITEMS)
+        self._add_to_log(_ITEM_USED + selected + "!")
     
     def _update_pokemon_display(self):
         """Update the Pokemon display area."""
         # Player Pokemon
-        for widget in self.player_pokemon_frame.winfo_children():
-            widget.destroy()
-        
         player_pokemon = ["Pikachu ⚡", "Charizard 🔥", "Blastoise 💧"]
-        for pokemon in player_pokemon:
-            pokemon_label = self.theme_manager.create_styled_label(
-                self.player_pokemon_frame,
-                text=pokemon,
-                font=('Arial', 10, 'bold')
-            )
-            pokemon_label.pack(pady=2)
-            
-            hp_label = self.theme_manager.create_styled_label(
-                self.player_pokemon_frame,
-                text="HP: 100/100",
-                font=('Arial', 9)
-            )
-            hp_label.pack(pady=(0, 10))
+        self._show_pokemon_slots(
+            self.player_pokemon_frame,
+            self._player_slots,
+            [(pokemon, "HP: 100/100") for pokemon in player_pokemon]
+        )
         
         # AI Pokemon
-        for widget in self.ai_pokemon_frame.winfo_children():
-            widget.destroy()
-        
         ai_pokemon = ["Gengar 👻", "Dragonite 🐉", "Mewtwo 🧠"]
-        for pokemon in ai_pokemon:
-            pokemon_label = self.theme_manager.create_styled_label(
-                self.ai_pokemon_frame,
-                text=pokemon,
-                font=('Arial', 10, 'bold')
-            )
-            pokemon_label.pack(pady=2)
-            
-            hp_label = self.theme_manager.create_styled_label(
-                self.ai_pokemon_frame,
-                text="HP: ???/???",
-                font=('Arial', 9)
-            )
-            hp_label.pack(pady=(0, 10))
+        self._show_pokemon_slots(
+            self.ai_pokemon_frame,
+            self._ai_slots,
+            [(pokemon, "HP: ???/???") for pokemon in ai_pokemon]
+        )
+    
+    def _show_pokemon_slots(self, frame, slots: list, entries: List[tuple]):
+        """Show (name, HP) entries in reusable label pairs, creating pairs only when needed."""
+        make_label = self.theme_manager.create_styled_label
+        while len(slots) < len(entries):
+            name_label = make_label(frame, text="", font=('Arial', 10, 'bold'))
+            hp_label = make_label(frame, text="", font=('Arial', 9))
+            slots.append((name_label, hp_label))
+        
+        for i, (name_label, hp_label) in enumerate(slots):
+            if i < len(entries):
+                name, hp = entries[i]
+                name_label.config(text=name)
+                hp_label.config(text=hp)
+                
+                # Shown slots are always a prefix, so re-packing keeps their order
+                if not name_label.winfo_manager():
+                    name_label.pack(pady=2)
+                    hp_label.pack(pady=(0, 10))
+            elif name_label.winfo_manager():
+                name_label.pack_forget()
+                hp_label.pack_forget()
     
     def _add_to_log(self, message: str):
         """Add a message to the battle log."""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self._add_lines_to_log([message])
+    
+    def _add_lines_to_log(self, messages: List[str]):
+        """Queue messages for the battle log; writes are coalesced every 50ms."""
+        for message in messages:
+            self._log_queue.put(message)
+        self._schedule_log_flush()
+    
+    def _schedule_log_flush(self):
+        """Arrange for _flush_log to run unless a flush is already pending."""
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Write all queued messages to the log widget with a single insert."""
+        self._log_flush_scheduled = False
+        
+        # Keep draining while the auto battle worker is still producing
+        if self._log_producer_running:
+            self._schedule_log_flush()
+        
+        messages = []
+        try:
+            while True:
+                messages.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if not messages:
+            return
         
         # Store in battle log history
-        self.battle_log.append(message)
\ No newline at end of file
+        self.battle_log.extend(messages)
+        
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert(tk.END, '\n'.join(messages) + '\n')
+        
+        # Drop the oldest lines so long sessions keep inserts and scrolling cheap
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > self.MAX_LOG_LINES:
+            self.log_text.delete('1.0', f'{line_count - self.MAX_LOG_LINES}.0')
+        
+        self.log_text.see(tk.END)
+        self.log_text.config(state=tk.DISABLED)
\ No newline at end of file
@@ -5,36 +5,90 @@ Provides the primary interface and navigation.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
+from functools import lru_cache, partial
+import importlib
 import sys
 import os
 
-# Add the src directory to the path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Add the project root to the path for imports when run outside run_gui.py
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
 
-from src.gui.theme_manager import ThemeManager, ThemeType
-from src.gui.team_builder_gui import TeamBuilderFrame
-from src.gui.battle_simulator_gui import BattleSimulatorFrame
-from src.gui.team_analysis_gui import TeamAnalysisFrame
-from src.gui.team_optimization_gui import TeamOptimizationFrame
-from src.gui.breeding_calculator_gui import BreedingCalculatorFrame
-from src.gui.tournament_system_gui import TournamentSystemFrame
-from src.gui.save_file_import_gui import SaveFileImportFrame
-from src.gui.social_community_gui import SocialCommunityFrame
-from src.gui.admin_panel_gui import AdminPanelFrame
+from src.gui.theme_manager import ThemeManager, ThemeType, center_window
+
+@lru_cache(maxsize=32)
+def _font(spec: tuple) -> tkfont.Font:
+    """Get a shared Font for a font tuple so Tk parses each spec only once."""
+    return tkfont.Font(font=spec)
+
+
+# Theme lookup for the theme combobox, which reports the selected value
+_THEME_BY_VALUE = {theme_type.value: theme_type for theme_type in ThemeType}
 
 
 class MainWindow:
     """Main application window for Pokemon Team Builder."""
     
+    # Feature key -> (module, frame class, status message); modules are
+    # imported on first visit so startup only loads what the user opens
+    _FEATURE_FRAMES = {
+        "team_builder": ("src.gui.team_builder_gui", "TeamBuilderFrame", "Team Builder loaded"),
+        "battle_simulator": ("src.gui.battle_simulator_gui", "BattleSimulatorFrame", "Battle Simulator loaded"),
+        "team_analysis": ("src.gui.team_analysis_gui", "TeamAnalysisFrame", "Team Analysis loaded"),
+        "team_optimization": ("src.gui.team_optimization_gui", "TeamOptimizationFrame", "Team Optimization loaded"),
+        "breeding_calculator": ("src.gui.breeding_calculator_gui", "BreedingCalculatorFrame", "Breeding Calculator loaded"),
+        "tournament_system": ("src.gui.tournament_system_gui", "TournamentSystemFrame", "Tournament System loaded"),
+        "save_file_import": ("src.gui.save_file_import_gui", "SaveFileImportFrame", "Save File Import loaded"),
+        "social_hub": ("src.gui.social_community_gui", "SocialCommunityFrame", "Social Community Hub loaded"),
+        "admin_panel": ("src.gui.admin_panel_gui", "AdminPanelFrame", "Admin Panel loaded")
+    }
+    
+    # Frames rebuilt on every visit instead of cached; the admin panel must
+    # ask for the admin PIN again each time it is opened
+    _UNCACHED_FRAMES = frozenset({"admin_panel"})
+    
+    # (attribute, label, feature key) for each navigation button, in display order
+    _NAV_BUTTONS = (
+        ("team_builder_btn", "🏗️ Team Builder", "team_builder"),
+        ("battle_sim_btn", "⚔️ Battle Simulator", "battle_simulator"),
+        ("analysis_btn", "📊 Team Analysis", "team_analysis"),
+        ("optimization_btn", "🔧 Team Optimization", "team_optimization"),
+        ("breeding_btn", "🥚 Breeding Calculator", "breeding_calculator"),
+        ("tournament_btn", "🏆 Tournament System", "tournament_system"),
+        ("import_btn", "💾 Save File Import", "save_file_import"),
+        ("social_btn", "🌟 Social Hub", "social_hub"),
+        ("admin_btn", "🔒 Admin Panel", "admin_panel")
+    )
+    
+    # (icon, title, description) for each welcome screen feature card
+    _FEATURES = (
+        ("🏗️", "Team Builder", "Comprehensive team building with all Pokemon generations"),
+        ("⚔️", "Battle Simulator", "Advanced battle simulation with AI opponents"),
+        ("📊", "Team Analysis", "In-depth analysis of type coverage and weaknesses"),
+        ("🔧", "Optimization", "AI-powered team optimization and suggestions"),
+        ("🥚", "Breeding Calculator", "Calculate breeding chains and inheritance"),
+        ("🏆", "Tournament System", "Create and manage Pokemon tournaments")
+    )
+    
     def __init__(self):
         self.root = tk.Tk()
         self.theme_manager = ThemeManager()
         self.current_frame = None
+        self._frame_cache = {}
+        self._theme_after_id = None
+        self._status_after_id = None
+        self._pending_status = self._shown_status = "Ready"
+        self._coming_soon_dialog = None
+        self._coming_soon_var = None
         
         self._setup_window()
         self._create_menu()
         self._create_main_content()
-        self._apply_theme()
+        
+        # Theme the first paint directly; later changes go through the debounce
+        self._do_apply_theme()
         
         # Bind theme change event
         self.root.bind('<<ThemeChanged>>', self._on_theme_changed)
@@ -42,16 +96,8 @@ class MainWindow:
     def _setup_window(self):
         """Setup the main window properties."""
         self.root.title("Pokemon Team Builder v1.0")
-        self.root.geometry("1200x800")
         self.root.minsize(1000, 600)
-        
-        # Center the window
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        center_window(self.root, 1200, 800)
         
         # Configure grid weights
         self.root.grid_rowconfigure(1, weight=1)
@@ -88,9 +134,9 @@ class MainWindow:
         # Tools menu
         tools_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Tools", menu=tools_menu)
-        tools_menu.add_command(label="Team Analysis", command=self._show_team_analysis)
-        tools_menu.add_command(label="Team Optimization", command=self._show_team_optimization)
-        tools_menu.add_command(label="Battle Simulator", command=self._show_battle_simulator)
+        tools_menu.add_command(label="Team Analysis", command=partial(self._show, 'team_analysis'))
+        tools_menu.add_command(label="Team Optimization", command=partial(self._show, 'team_optimization'))
+        tools_menu.add_command(label="Battle Simulator", command=partial(self._show, 'battle_simulator'))
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -100,13 +146,17 @@ class MainWindow:
     
     def _create_main_content(self):
         """Create the main content area."""
+        make_label = self.theme_manager.create_styled_label
+        make_frame = self.theme_manager.create_styled_frame
+        make_button = self.theme_manager.create_styled_button
+        
         # Header
-        header_frame = self.theme_manager.create_styled_frame(self.root)
+        header_frame = make_frame(self.root)
         header_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=5)
         header_frame.grid_columnconfigure(1, weight=1)
         
         # Logo/Title
-        title_label = self.theme_manager.create_styled_label(
+        title_label = make_label(
             header_frame,
             text="🎮 Pokemon Team Builder",
             font=('Arial', 20, 'bold')
@@ -117,7 +167,7 @@ class MainWindow:
         theme_frame = tk.Frame(header_frame)
         theme_frame.grid(row=0, column=1, sticky="e", padx=10)
         
-        theme_label = self.theme_manager.create_styled_label(theme_frame, text="Theme:")
+        theme_label = make_label(theme_frame, text="Theme:")
         theme_label.pack(side=tk.LEFT, padx=(0, 5))
         
         self.theme_var = tk.StringVar(value=self.theme_manager.current_theme.value)
@@ -132,179 +182,102 @@ class MainWindow:
         theme_combo.bind('<<ComboboxSelected>>', self._on_theme_combo_changed)
         
         # Main content area
-        self.content_frame = self.theme_manager.create_styled_frame(self.root)
+        self.content_frame = make_frame(self.root)
         self.content_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
         
         # Navigation buttons
-        nav_frame = self.theme_manager.create_styled_frame(self.content_frame)
+        nav_frame = make_frame(self.content_frame)
         nav_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        # Team Builder button
-        self.team_builder_btn = self.theme_manager.create_styled_button(
-            nav_frame,
-            text="🏗️ Team Builder",
-            command=self._show_team_builder
-        )
-        self.team_builder_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Battle Simulator button
-        self.battle_sim_btn = self.theme_manager.create_styled_button(
-            nav_frame,
-            text="⚔️ Battle Simulator",
-            command=self._show_battle_simulator
-        )
-        self.battle_sim_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Team Analysis button
-        self.analysis_btn = self.theme_manager.create_styled_button(
-            nav_frame,
-            text="📊 Team Analysis",
-            command=self._show_team_analysis
-        )
-        self.analysis_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Team Optimization button
-        self.optimization_btn = self.theme_manager.create_styled_button(
-            nav_frame,
-            text="🔧 Team Optimization",
-            command=self._show_team_optimization
-        )
-        self.optimization_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Breeding Calculator button
-        self.breeding_btn = self.theme_manager.create_styled_button(
-            nav_frame,
-            text="🥚 Breeding Calculator",
-            command=self._show_breeding_calculator
-        )
-        self.breeding_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Tournament System button
-        self.tournament_btn = self.theme_manager.create_styled_button(
-            nav_frame,
-            text="🏆 Tournament System",
-            command=self._show_tournament_system
-        )
-        self.tournament_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Save File Import button
-        self.import_btn = self.theme_manager.create_styled_button(
-            nav_frame,
-            text="💾 Save File Import",
-            command=self._show_save_file_import
-        )
-        self.import_btn.pack(side=tk.LEFT, padx=5)
+        for attr, label, key in self._NAV_BUTTONS:
+            button = make_button(
+                nav_frame,
+                text=label,
+                command=partial(self._show, key)
+            )
+            button.pack(side=tk.LEFT, padx=5)
+            setattr(self, attr, button)
         
-        # Social Community button
-        self.social_btn = self.theme_manager.create_styled_button(
-            nav_frame,
-            text="🌟 Social Hub",
-            command=self._show_social_hub
-        )
-        self.social_btn.pack(side=tk.LEFT, padx=5)
+        # Welcome message with enhanced layout
+        self._build_welcome_screen()
         
-        # Admin Panel button
-        self.admin_btn = self.theme_manager.create_styled_button(
-            nav_frame,
-            text="🔒 Admin Panel",
-            command=self._show_admin_panel
+        # Status bar
+        self.status_bar = make_label(
+            self.root,
+            text="Ready",
+            relief=tk.SUNKEN,
+            anchor=tk.W
         )
-        self.admin_btn.pack(side=tk.LEFT, padx=5)
+        self.status_bar.grid(row=2, column=0, sticky="ew", padx=10, pady=2)
+    
+    def _build_welcome_screen(self):
+        """Create the welcome screen shown in the content area at startup."""
+        make_label = self.theme_manager.create_styled_label
+        make_frame = self.theme_manager.create_styled_frame
+        make_button = self.theme_manager.create_styled_button
         
-        # Welcome message with enhanced layout
-        self.welcome_frame = self.theme_manager.create_styled_frame(self.content_frame)
-        self.welcome_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        # Packed only once all children exist so Tk lays the screen out in one pass
+        self.welcome_frame = make_frame(self.content_frame)
         
         # Hero section
-        hero_frame = self.theme_manager.create_styled_frame(self.welcome_frame)
+        hero_frame = make_frame(self.welcome_frame)
         hero_frame.pack(fill=tk.X, pady=(0, 30))
         
-        welcome_label = self.theme_manager.create_styled_label(
+        welcome_label = make_label(
             hero_frame,
             text="🎮 Pokemon Team Builder",
-            font=('Arial', 28, 'bold')
+            font=_font(('Arial', 28, 'bold'))
         )
         welcome_label.pack(pady=(20, 10))
         
-        subtitle_label = self.theme_manager.create_styled_label(
+        subtitle_label = make_label(
             hero_frame,
             text="Build, analyze, and optimize your Pokemon teams for competitive play!",
-            font=('Arial', 16)
+            font=_font(('Arial', 16))
         )
         subtitle_label.pack(pady=(0, 10))
         
-        version_label = self.theme_manager.create_styled_label(
+        version_label = make_label(
             hero_frame,
             text="Version 1.0 • Multi-Platform Support • Enhanced Features",
-            font=('Arial', 12, 'italic')
+            font=_font(('Arial', 12, 'italic'))
         )
         version_label.pack(pady=(0, 20))
         
         # Feature highlights with modern card layout
-        features_title = self.theme_manager.create_styled_label(
+        features_title = make_label(
             self.welcome_frame,
             text="✨ Key Features",
-            font=('Arial', 18, 'bold')
+            font=_font(('Arial', 18, 'bold'))
         )
         features_title.pack(pady=(0, 15))
         
-        # Create a grid of feature cards
-        cards_frame = self.theme_manager.create_styled_frame(self.welcome_frame)
-        cards_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        features = [
-            {"icon": "�️", "title": "Team Builder", "desc": "Comprehensive team building with all Pokemon generations"},
-            {"icon": "⚔️", "title": "Battle Simulator", "desc": "Advanced battle simulation with AI opponents"},
-            {"icon": "📊", "title": "Team Analysis", "desc": "In-depth analysis of type coverage and weaknesses"},
-            {"icon": "🔧", "title": "Optimization", "desc": "AI-powered team optimization and suggestions"},
-            {"icon": "🥚", "title": "Breeding Calculator", "desc": "Calculate breeding chains and inheritance"},
-            {"icon": "�", "title": "Tournament System", "desc": "Create and manage Pokemon tournaments"}
-        ]
-        
-        # Create feature cards in 2 columns
-        for i, feature in enumerate(features):
-            row = i // 2
-            col = i % 2
-            
-            card_frame = self.theme_manager.create_styled_frame(cards_frame)
-            card_frame.grid(row=row, column=col, padx=10, pady=8, sticky="ew")
-            cards_frame.grid_columnconfigure(col, weight=1)
-            
-            # Icon
-            icon_label = self.theme_manager.create_styled_label(
-                card_frame,
-                text=feature["icon"],
-                font=('Arial', 20)
-            )
-            icon_label.pack(side=tk.LEFT, padx=(15, 10), pady=15)
-            
-            # Text content
-            text_frame = tk.Frame(card_frame)
-            text_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=10)
-            
-            title_label = self.theme_manager.create_styled_label(
-                text_frame,
-                text=feature["title"],
-                font=('Arial', 14, 'bold')
-            )
-            title_label.pack(anchor=tk.W)
-            
-            desc_label = self.theme_manager.create_styled_label(
-                text_frame,
-                text=feature["desc"],
-                font=('Arial', 11),
-                wraplength=250
-            )
-            desc_label.pack(anchor=tk.W, pady=(2, 0))
+        # All feature highlights share one read-only Text widget
+        features_text = tk.Text(
+            self.welcome_frame,
+            height=len(self._FEATURES),
+            wrap=tk.WORD,
+            borderwidth=0,
+            font=_font(('Arial', 11))
+        )
+        features_text.tag_configure('icon', font=_font(('Arial', 16)))
+        features_text.tag_configure('title', font=_font(('Arial', 14, 'bold')))
+        
+        chunks = []
+        for icon, title, desc in self._FEATURES:
+            chunks.extend((f"{icon}  ", 'icon', title, 'title', f"  {desc}\n", ()))
+        features_text.insert('1.0', *chunks)
+        features_text.config(state=tk.DISABLED)
+        features_text.pack(fill=tk.X, padx=20, pady=10)
         
         # Quick start section
-        quick_start_frame = self.theme_manager.create_styled_frame(self.welcome_frame)
+        quick_start_frame = make_frame(self.welcome_frame)
         quick_start_frame.pack(fill=tk.X, pady=(30, 10))
         
-        quick_title = self.theme_manager.create_styled_label(
+        quick_title = make_label(
             quick_start_frame,
             text="🚀 Quick Start",
-            font=('Arial', 16, 'bold')
+            font=_font(('Arial', 16, 'bold'))
         )
         quick_title.pack(pady=(0, 10))
         
@@ -312,101 +285,47 @@ class MainWindow:
         quick_buttons_frame = tk.Frame(quick_start_frame)
         quick_buttons_frame.pack()
         
-        self.quick_team_btn = self.theme_manager.create_styled_button(
+        self.quick_team_btn = make_button(
             quick_buttons_frame,
             text="🏗️ Start Building",
-            command=self._show_team_builder,
+            command=partial(self._show, 'team_builder'),
             width=15
         )
         self.quick_team_btn.pack(side=tk.LEFT, padx=5)
         
-        self.quick_battle_btn = self.theme_manager.create_styled_button(
+        self.quick_battle_btn = make_button(
             quick_buttons_frame,
             text="⚔️ Quick Battle",
-            command=self._show_battle_simulator,
+            command=partial(self._show, 'battle_simulator'),
             width=15
         )
         self.quick_battle_btn.pack(side=tk.LEFT, padx=5)
         
-        self.quick_analyze_btn = self.theme_manager.create_styled_button(
+        self.quick_analyze_btn = make_button(
             quick_buttons_frame,
             text="📊 Analyze Team",
-            command=self._show_team_analysis,
+            command=partial(self._show, 'team_analysis'),
             width=15
         )
         self.quick_analyze_btn.pack(side=tk.LEFT, padx=5)
         
-        # Status bar
-        self.status_bar = self.theme_manager.create_styled_label(
-            self.root,
-            text="Ready",
-            relief=tk.SUNKEN,
-            anchor=tk.W
-        )
-        self.status_bar.grid(row=2, column=0, sticky="ew", padx=10, pady=2)
-    
-    def _show_team_builder(self):
-        """Show the team builder interface."""
-        self._clear_content()
-        self.current_frame = TeamBuilderFrame(self.content_frame, self.theme_manager)
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._update_status("Team Builder loaded")
-    
-    def _show_battle_simulator(self):
-        """Show the battle simulator interface."""
-        self._clear_content()
-        self.current_frame = BattleSimulatorFrame(self.content_frame, self.theme_manager)
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._update_status("Battle Simulator loaded")
-    
-    def _show_team_analysis(self):
-        """Show the team analysis interface."""
-        self._clear_content()
-        self.current_frame = TeamAnalysisFrame(self.content_frame, self.theme_manager)
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._update_status("Team Analysis loaded")
-    
-    def _show_team_optimization(self):
-        """Show the team optimization interface."""
-        self._clear_content()
-        self.current_frame = TeamOptimizationFrame(self.content_frame, self.theme_manager)
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._update_status("Team Optimization loaded")
-    
-    def _show_breeding_calculator(self):
-        """Show the breeding calculator interface."""
-        self._clear_content()
-        self.current_frame = BreedingCalculatorFrame(self.content_frame, self.theme_manager)
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._update_status("Breeding Calculator loaded")
-    
-    def _show_tournament_system(self):
-        """Show the tournament system interface."""
-        self._clear_content()
-        self.current_frame = TournamentSystemFrame(self.content_frame, self.theme_manager)
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._update_status("Tournament System loaded")
-    
-    def _show_save_file_import(self):
-        """Show the save file import interface."""
-        self._clear_content()
-        self.current_frame = SaveFileImportFrame(self.content_frame, self.theme_manager)
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._update_status("Save File Import loaded")
-    
-    def _show_social_hub(self):
-        """Show the social community hub interface."""
-        self._clear_content()
-        self.current_frame = SocialCommunityFrame(self.content_frame, self.theme_manager)
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._update_status("Social Community Hub loaded")
+        self.welcome_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
     
-    def _show_admin_panel(self):
-        """Show the admin panel interface."""
+    def _show(self, key: str):
+        """Show a feature frame, building it on the first visit and reusing it after."""
+        module_name, class_name, status = self._FEATURE_FRAMES[key]
         self._clear_content()
-        self.current_frame = AdminPanelFrame(self.content_frame, self.theme_manager)
+        
+        frame = self._frame_cache.get(key)
+        if frame is None:
+            frame_class = getattr(importlib.import_module(module_name), class_name)
+            frame = frame_class(self.content_frame, self.theme_manager)
+            if key not in self._UNCACHED_FRAMES:
+                self._frame_cache[key] = frame
+        
+        self.current_frame = frame
         self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._update_status("Admin Panel loaded")
+        self._update_status(status)
     
     def _clear_content(self):
         """Clear the current content frame."""
@@ -415,9 +334,12 @@ class MainWindow:
             self.welcome_frame.destroy()
             self.welcome_frame = None
         
-        # Destroy current frame if it exists
+        # Hide the current frame; cached frames are kept for the next visit
         if self.current_frame:
-            self.current_frame.destroy()
+            if self.current_frame in self._frame_cache.values():
+                self.current_frame.pack_forget()
+            else:
+                self.current_frame.destroy()
             self.current_frame = None
     
     def _change_theme(self, theme_type: ThemeType):
@@ -429,14 +351,19 @@ class MainWindow:
     
     def _on_theme_combo_changed(self, event):
         """Handle theme combo box selection change."""
-        theme_name = self.theme_var.get()
-        for theme_type in ThemeType:
-            if theme_type.value == theme_name:
-                self._change_theme(theme_type)
-                break
+        theme_type = _THEME_BY_VALUE.get(self.theme_var.get())
+        if theme_type is not None:
+            self._change_theme(theme_type)
     
     def _apply_theme(self):
+        """Schedule a theme pass so bursts of changes walk the widget tree once."""
+        if self._theme_after_id is not None:
+            return
+        self._theme_after_id = self.root.after(30, self._do_apply_theme)
+    
+    def _do_apply_theme(self):
         """Apply the current theme to all widgets."""
+        self._theme_after_id = None
         self.theme_manager.apply_theme(self.root)
     
     def _on_theme_changed(self, event):
@@ -444,23 +371,70 @@ class MainWindow:
         self._apply_theme()
     
     def _update_status(self, message: str):
-        """Update the status bar message."""
-        self.status_bar.config(text=message)
+        """Update the status bar message once the current burst of updates settles."""
+        self._pending_status = message
+        if self._status_after_id is None:
+            self._status_after_id = self.root.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """Write the latest pending status message if it differs from the shown one."""
+        self._status_after_id = None
+        if self._pending_status != self._shown_status:
+            self._shown_status = self._pending_status
+            self.status_bar.config(text=self._shown_status)
     
     def _new_team(self):
         """Create a new team."""
         self._update_status("New Team - Coming Soon!")
-        messagebox.showinfo("Coming Soon", "New Team functionality will be available in the next update!")
+        self._show_coming_soon("New Team functionality will be available in the next update!")
     
     def _open_team(self):
         """Open an existing team."""
         self._update_status("Open Team - Coming Soon!")
-        messagebox.showinfo("Coming Soon", "Open Team functionality will be available in the next update!")
+        self._show_coming_soon("Open Team functionality will be available in the next update!")
     
     def _save_team(self):
         """Save the current team."""
         self._update_status("Save Team - Coming Soon!")
-        messagebox.showinfo("Coming Soon", "Save Team functionality will be available in the next update!")
+        self._show_coming_soon("Save Team functionality will be available in the next update!")
+    
+    def _show_coming_soon(self, message: str):
+        """Show the shared "Coming Soon" dialog with the given message."""
+        if self._coming_soon_dialog is None:
+            self._coming_soon_dialog = self._build_coming_soon_dialog()
+        
+        self._coming_soon_var.set(message)
+        self._coming_soon_dialog.deiconify()
+        self._coming_soon_dialog.lift()
+    
+    def _build_coming_soon_dialog(self) -> tk.Toplevel:
+        """Create the reusable "Coming Soon" dialog."""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Coming Soon")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        
+        self._coming_soon_var = tk.StringVar()
+        message_label = self.theme_manager.create_styled_label(
+            dialog,
+            text="",
+            textvariable=self._coming_soon_var,
+            font=('Arial', 11),
+            wraplength=320
+        )
+        message_label.pack(padx=20, pady=(20, 10))
+        
+        ok_btn = self.theme_manager.create_styled_button(
+            dialog,
+            text="OK",
+            command=dialog.withdraw,
+            width=10
+        )
+        ok_btn.pack(pady=(0, 15))
+        
+        self.theme_manager.apply_theme(dialog)
+        return dialog
     
     def _exit_app(self):
         """Exit the application."""
@@ -487,7 +461,7 @@ Created with ❤️ for Pokemon fans everywhere!"""
     def _show_documentation(self):
         """Show the documentation."""
         self._update_status("Documentation - Coming Soon!")
-        messagebox.showinfo("Coming Soon", "Documentation will be available in the next update!")
+        self._show_coming_soon("Documentation will be available in the next update!")
     
     def run(self):
         """Start the main application loop."""
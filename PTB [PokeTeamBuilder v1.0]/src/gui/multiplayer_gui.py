@@ -5,24 +5,31 @@ Provides user interface for matchmaking, battle management, and spectating.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import threading
+import queue
 import time
 import json
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
-from teambuilder.team import PokemonTeam
+from src.teambuilder.team import PokemonTeam
 try:
     from .online_multiplayer import (
         OnlineBattleManager, BattlePlayer, BattleMode, BattleFormat,
         PlayerStatus, BattlePhase, BattleMessage
     )
+    
+    # Combobox choices, enumerated once instead of on every tab build
+    _BATTLE_MODE_VALUES = tuple(mode.value for mode in BattleMode)
+    _BATTLE_FORMAT_VALUES = tuple(fmt.value for fmt in BattleFormat)
 except ImportError:
     # Mock classes if online_multiplayer is not available
     class OnlineBattleManager:
         def __init__(self):
             pass
+        def register_callback(self, event_type, callback):
+            pass
     class BattlePlayer:
+        __slots__ = ('name',)
         def __init__(self, name):
             self.name = name
     class BattleMode:
@@ -34,12 +41,39 @@ except ImportError:
     class BattlePhase:
         LOBBY = "lobby"
     class BattleMessage:
+        __slots__ = ('message',)
         def __init__(self, message):
             self.message = message
+    
+    _BATTLE_MODE_VALUES = (BattleMode.SINGLES,)
+    _BATTLE_FORMAT_VALUES = (BattleFormat.CASUAL,)
+
+class _QueueDiffer:
+    """Queue (key, payload) updates for the Tk thread, skipping unchanged payloads."""
+    
+    __slots__ = ('queue', '_last')
+    
+    def __init__(self):
+        self.queue = queue.Queue()
+        self._last = {}
+    
+    def put(self, key: str, payload: Any) -> bool:
+        """Queue a payload unless it equals the last one queued under the same key.
+        
+        Returns True if the payload was queued.
+        """
+        if self._last.get(key) == payload:
+            return False
+        self._last[key] = payload
+        self.queue.put((key, payload))
+        return True
 
 class MultiplayerLobbyGUI:
     """Main lobby interface for online multiplayer."""
     
+    # The lobby opened through open(); closing it only hides the window
+    _instance: Optional['MultiplayerLobbyGUI'] = None
+    
     def __init__(self, parent, battle_manager: OnlineBattleManager):
         self.parent = parent
         self.battle_manager = battle_manager
@@ -53,12 +87,31 @@ class MultiplayerLobbyGUI:
         self.window.resizable(True, True)
         
         self.setup_ui()
-        self.update_thread_running = True
-        self.update_thread = threading.Thread(target=self.update_loop, daemon=True)
-        self.update_thread.start()
+        
+        # Battle manager callbacks may run on its threads, so they only queue
+        # display payloads and post <<LobbyUpdate>>; Tk is updated by
+        # _drain_updates on the main loop, and nothing runs while idle
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._updates = _QueueDiffer()
+        self._drain_pending = False
+        self.window.bind('<<LobbyUpdate>>', self._drain_updates)
+        self._created_time_cache: Dict[str, str] = {}  # battle id -> formatted creation time; Tk thread only
+        self.battle_manager.register_callback('battles_changed', self._on_battles_changed)
         
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.window.bind('<Destroy>', self._on_destroy)
+    
+    @classmethod
+    def open(cls, parent) -> 'MultiplayerLobbyGUI':
+        """Show the lobby, reusing the window hidden by an earlier close."""
+        lobby = cls._instance
+        if lobby is None:
+            lobby = cls._instance = cls(parent, OnlineBattleManager())
+        else:
+            lobby.window.deiconify()
+            lobby.window.lift()
+        return lobby
     
     def setup_ui(self):
         """Setup the lobby user interface."""
@@ -74,17 +127,21 @@ class MultiplayerLobbyGUI:
         # Private Battle tab
         self.private_battle_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.private_battle_frame, text="Private Battle")
-        self.setup_private_battle_tab()
         
         # Battle List tab
         self.battle_list_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.battle_list_frame, text="Active Battles")
-        self.setup_battle_list_tab()
         
         # Profile tab
         self.profile_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.profile_frame, text="Profile")
-        self.setup_profile_tab()
+        
+        # The hidden tabs are filled in by _on_tab_changed on first view
+        self._tab_builders = {
+            1: self.setup_private_battle_tab,
+            2: self.setup_battle_list_tab,
+            3: self.setup_profile_tab
+        }
         
         # Status bar
         self.status_var = tk.StringVar(value="Ready")
@@ -126,13 +183,13 @@ class MultiplayerLobbyGUI:
         ttk.Label(settings_frame, text="Mode:").grid(row=0, column=0, sticky='w')
         self.mode_var = tk.StringVar(value=BattleMode.SINGLES.value)
         self.mode_combo = ttk.Combobox(settings_frame, textvariable=self.mode_var, 
-                                      values=[mode.value for mode in BattleMode], state='readonly')
+                                      values=_BATTLE_MODE_VALUES, state='readonly')
         self.mode_combo.grid(row=0, column=1, padx=5, sticky='ew')
         
         ttk.Label(settings_frame, text="Format:").grid(row=1, column=0, sticky='w')
         self.format_var = tk.StringVar(value=BattleFormat.CASUAL.value)
         self.format_combo = ttk.Combobox(settings_frame, textvariable=self.format_var,
-                                        values=[fmt.value for fmt in BattleFormat], state='readonly')
+                                        values=_BATTLE_FORMAT_VALUES, state='readonly')
         self.format_combo.grid(row=1, column=1, padx=5, sticky='ew')
         
         settings_frame.columnconfigure(1, weight=1)
@@ -163,13 +220,13 @@ class MultiplayerLobbyGUI:
         ttk.Label(create_frame, text="Mode:").grid(row=0, column=0, sticky='w')
         self.private_mode_var = tk.StringVar(value=BattleMode.SINGLES.value)
         self.private_mode_combo = ttk.Combobox(create_frame, textvariable=self.private_mode_var,
-                                              values=[mode.value for mode in BattleMode], state='readonly')
+                                              values=_BATTLE_MODE_VALUES, state='readonly')
         self.private_mode_combo.grid(row=0, column=1, padx=5, sticky='ew')
         
         ttk.Label(create_frame, text="Format:").grid(row=1, column=0, sticky='w')
         self.private_format_var = tk.StringVar(value=BattleFormat.CUSTOM.value)
         self.private_format_combo = ttk.Combobox(create_frame, textvariable=self.private_format_var,
-                                                values=[fmt.value for fmt in BattleFormat], state='readonly')
+                                                values=_BATTLE_FORMAT_VALUES, state='readonly')
         self.private_format_combo.grid(row=1, column=1, padx=5, sticky='ew')
         
         # Advanced settings
@@ -216,6 +273,7 @@ class MultiplayerLobbyGUI:
         # Treeview for battles
         columns = ('ID', 'Mode', 'Format', 'Players', 'Phase', 'Created')
         self.battle_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=15)
+        self._battle_row_cache: Dict[str, tuple] = {}  # battle id (tree iid) -> raw values of the shown row
         
         for col in columns:
             self.battle_tree.heading(col, text=col)
@@ -243,6 +301,8 @@ class MultiplayerLobbyGUI:
         
         self.refresh_btn = ttk.Button(controls_frame, text="Refresh", command=self.refresh_battle_list)
         self.refresh_btn.pack(side='left', padx=5)
+        
+        self.refresh_battle_list()
     
     def setup_profile_tab(self):
         """Setup profile interface."""
@@ -252,6 +312,7 @@ class MultiplayerLobbyGUI:
         # Profile info
         self.profile_info = tk.Text(profile_frame, height=10, width=50)
         self.profile_info.pack(fill='both', expand=True)
+        self._shown_profile_text = ""
         
         # Update profile display
         self.update_profile_display()
@@ -394,24 +455,56 @@ class MultiplayerLobbyGUI:
     
     def refresh_battle_list(self):
         """Refresh the battle list."""
-        # Clear current items
-        for item in self.battle_tree.get_children():
-            self.battle_tree.delete(item)
-        
-        # Get battle list
-        battles = self.battle_manager.get_battle_list()
+        self._show_battle_rows(self._battle_rows())
+    
+    def _battle_rows(self) -> List[tuple]:
+        """Build (battle_id, values) rows; safe to call off the Tk thread.
         
-        # Add battles to tree
-        for battle in battles:
-            created_time = datetime.fromisoformat(battle['created_at']).strftime("%H:%M:%S")
-            self.battle_tree.insert('', 'end', values=(
+        The last value is the raw ISO creation time; _show_battle_rows
+        formats it for display.
+        """
+        return [
+            (battle['battle_id'], (
                 battle['battle_id'][:8],  # Shortened ID
                 battle['mode'].title(),
                 battle['format'].title(),
                 f"{battle['players']}/2",
                 battle['phase'].replace('_', ' ').title(),
-                created_time
+                battle['created_at']
             ))
+            for battle in self.battle_manager.get_battle_list()
+        ]
+    
+    def _show_battle_rows(self, rows: List[tuple]):
+        """Bring the battle list in line with the given rows, touching only changed ones."""
+        cache = self._battle_row_cache
+        current = dict(rows)
+        
+        # Drop battles that are gone
+        for battle_id in [bid for bid in cache if bid not in current]:
+            self.battle_tree.delete(battle_id)
+            del cache[battle_id]
+            self._created_time_cache.pop(battle_id, None)
+        
+        # Update changed rows and add new ones
+        for battle_id, values in rows:
+            shown = cache.get(battle_id)
+            if shown is None:
+                self.battle_tree.insert('', 'end', iid=battle_id, values=self._display_values(battle_id, values))
+            elif shown != values:
+                self.battle_tree.item(battle_id, values=self._display_values(battle_id, values))
+            else:
+                continue
+            cache[battle_id] = values
+    
+    def _display_values(self, battle_id: str, values: tuple) -> tuple:
+        """Replace a row's raw creation time with its display form; runs on the Tk thread."""
+        # A battle's creation time never changes, so parse it only once
+        created_time = self._created_time_cache.get(battle_id)
+        if created_time is None:
+            created_time = datetime.fromisoformat(values[-1]).strftime("%H:%M:%S")
+            self._created_time_cache[battle_id] = created_time
+        return values[:-1] + (created_time,)
     
     def open_battle_window(self, battle_id: str, spectator: bool = False):
         """Open battle window."""
@@ -420,6 +513,10 @@ class MultiplayerLobbyGUI:
     
     def update_profile_display(self):
         """Update profile display."""
+        self._show_profile_text(self._profile_text())
+    
+    def _profile_text(self) -> str:
+        """Build the profile text."""
         if self.current_user:
             profile_text = f"""Username: {self.current_user.username}
 Player ID: {self.current_user.id}
@@ -439,40 +536,74 @@ Current Activity:
         else:
             profile_text = "Not logged in"
         
-        self.profile_info.delete(1.0, tk.END)
-        self.profile_info.insert(1.0, profile_text)
+        return profile_text
     
-    def update_loop(self):
-        """Background update loop."""
-        while self.update_thread_running:
+    def _show_profile_text(self, profile_text: str):
+        """Replace the profile display contents if they changed."""
+        if profile_text == self._shown_profile_text:
+            return
+        self.profile_info.replace(1.0, tk.END, profile_text)
+        self._shown_profile_text = profile_text
+    
+    def _on_tab_changed(self, event=None):
+        """Build a tab on its first view; the profile is refreshed on every view."""
+        index = self.notebook.index('current')
+        
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder()
+        elif index == 3:  # Profile tab
+            self.update_profile_display()
+    
+    def _on_battles_changed(self):
+        """Queue fresh battle list rows; may be called from a battle manager thread."""
+        if 2 in self._tab_builders:
+            return  # The battle list tab loads its rows when first built
+        if self._updates.put('battles', self._battle_rows()) and not self._drain_pending:
+            # One drain per burst of updates; it clears the flag before draining
+            self._drain_pending = True
             try:
-                # Update battle list
-                if self.notebook.index('current') == 2:  # Battle list tab
-                    self.refresh_battle_list()
-                
-                # Update profile
-                if self.notebook.index('current') == 3:  # Profile tab
-                    self.update_profile_display()
-                
-                time.sleep(5)  # Update every 5 seconds
-                
-            except Exception as e:
-                print(f"Update loop error: {e}")
-                time.sleep(5)
+                self.window.event_generate('<<LobbyUpdate>>', when='tail')
+            except tk.TclError:
+                pass  # Lobby window already destroyed
+    
+    def _drain_updates(self, event=None):
+        """Apply payloads queued by battle manager callbacks; runs on the Tk main loop."""
+        self._drain_pending = False
+        try:
+            while True:
+                key, payload = self._updates.queue.get_nowait()
+                if key == 'battles':
+                    self._show_battle_rows(payload)
+        except queue.Empty:
+            pass
     
     def on_close(self):
-        """Handle window close."""
-        self.update_thread_running = False
+        """Handle window close by hiding the lobby until it is opened again."""
+        self.window.withdraw()
+    
+    def _on_destroy(self, event):
+        """Tear down the session when the lobby window is destroyed with its parent."""
+        # <Destroy> on a Toplevel also fires for each of its children
+        if event.widget is not self.window:
+            return
         
         # Disconnect user
         if self.current_user:
             self.battle_manager.handle_disconnect("gui_connection")
         
-        self.window.destroy()
+        if MultiplayerLobbyGUI._instance is self:
+            MultiplayerLobbyGUI._instance = None
 
 class BattleGUI:
     """GUI for participating in or spectating battles."""
     
+    # Refresh delays (ms) for phases where nothing moves vs. a live battle
+    IDLE_PHASES = ('lobby', 'finished', 'battle_end')
+    IDLE_POLL_MS = 5000
+    ACTIVE_POLL_MS = 250
+    MAX_LOG_LINES = 500
+    
     def __init__(self, parent, battle_manager: OnlineBattleManager, 
                  battle_id: str, player: Optional[BattlePlayer], spectator: bool = False):
         self.parent = parent
@@ -488,15 +619,24 @@ class BattleGUI:
         self.window.geometry("1000x700")
         self.window.resizable(True, True)
         
+        # Last text written to each read-only Text widget, and the state
+        # fields behind the last render
+        self._shown_text: Dict[tk.Text, str] = {}
+        self._render_key = None
+        
+        # Lines waiting to be appended to the log/chat widgets on the next idle pass
+        self._pending_appends: Dict[tk.Text, List[str]] = {}
+        self._append_flush_id = None
+        
         self.setup_ui()
         
-        # Update thread
-        self.update_thread_running = True
-        self.update_thread = threading.Thread(target=self.update_loop, daemon=True)
-        self.update_thread.start()
+        # Periodic refresh, scheduled on the Tk main loop
+        self._poll_delay = self.ACTIVE_POLL_MS
+        self._after_id = self.window.after(self._poll_delay, self._tick)
         
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.window.bind('<Destroy>', self._on_destroy)
     
     def setup_ui(self):
         """Setup battle user interface."""
@@ -620,67 +760,91 @@ class BattleGUI:
         message = self.chat_entry.get().strip()
         if message:
             # Add to chat display
-            self.chat_display.config(state='normal')
-            self.chat_display.insert(tk.END, f"You: {message}\n")
-            self.chat_display.config(state='disabled')
-            self.chat_display.see(tk.END)
+            self._append_capped(self.chat_display, f"You: {message}\n")
             
             self.chat_entry.delete(0, tk.END)
     
     def add_to_log(self, message: str):
         """Add message to battle log."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.battle_log.config(state='normal')
-        self.battle_log.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.battle_log.config(state='disabled')
-        self.battle_log.see(tk.END)
+        self._append_capped(self.battle_log, f"[{timestamp}] {message}\n")
+    
+    def _append_capped(self, widget: tk.Text, text: str):
+        """Queue text for a read-only Text widget; appends are flushed together when idle."""
+        self._pending_appends.setdefault(widget, []).append(text)
+        if self._append_flush_id is None:
+            self._append_flush_id = self.window.after_idle(self._flush_appends)
+    
+    def _flush_appends(self):
+        """Write queued text with one insert per widget, keeping only the newest MAX_LOG_LINES."""
+        self._append_flush_id = None
+        pending, self._pending_appends = self._pending_appends, {}
+        
+        for widget, texts in pending.items():
+            widget.config(state='normal')
+            widget.insert(tk.END, ''.join(texts))
+            
+            # Drop the oldest lines so long battles keep inserts and scrolling cheap
+            line_count = int(widget.index('end-1c').split('.')[0])
+            if line_count > self.MAX_LOG_LINES:
+                widget.delete('1.0', f'{line_count - self.MAX_LOG_LINES}.0')
+            
+            widget.config(state='disabled')
+            widget.see(tk.END)
     
-    def update_display(self):
-        """Update the battle display."""
+    def update_display(self) -> Optional[Dict[str, Any]]:
+        """Update the battle display and return the battle state it showed."""
         # Get battle state
         battle_state = self.battle_manager.get_battle_state(self.battle_id)
         
         if battle_state:
+            # Players in a stable order so unchanged players compare equal
+            players = [info for _, info in sorted(battle_state['players'].items())]
+            timer = battle_state['timer']
+            remaining = int(timer['remaining']) if timer['enabled'] else None
+            
+            # Skip the render when none of the fields it shows have changed
+            render_key = (
+                battle_state['phase'],
+                battle_state['turn_number'],
+                remaining,
+                tuple((info['username'], info['status'], info['ready']) for info in players)
+            )
+            if render_key == self._render_key:
+                return battle_state
+            self._render_key = render_key
+            
             # Update status
             self.phase_var.set(battle_state['phase'].replace('_', ' ').title())
             self.turn_var.set(str(battle_state['turn_number']))
             
             # Update timer
-            if battle_state['timer']['enabled']:
-                remaining = int(battle_state['timer']['remaining'])
+            if remaining is not None:
                 self.timer_var.set(f"{remaining}s")
             else:
                 self.timer_var.set("--")
             
             # Update players info
-            self.players_info.config(state='normal')
-            self.players_info.delete(1.0, tk.END)
-            
             players_text = ""
-            for player_id, player_info in battle_state['players'].items():
+            for player_info in players:
                 status_emoji = "🟢" if player_info['ready'] else "🔴"
                 players_text += f"{status_emoji} {player_info['username']}\n"
                 players_text += f"   Status: {player_info['status'].title()}\n\n"
             
-            self.players_info.insert(1.0, players_text)
-            self.players_info.config(state='disabled')
+            self._show_text(self.players_info, players_text)
             
             # Update battle field display
-            self.battle_display.config(state='normal')
-            self.battle_display.delete(1.0, tk.END)
-            
             field_text = f"""Battle ID: {self.battle_id}
 Phase: {battle_state['phase'].replace('_', ' ').title()}
 Turn: {battle_state['turn_number']}
 
 Players:
-{chr(10).join(f"- {info['username']} ({info['status']})" for info in battle_state['players'].values())}
+{chr(10).join(f"- {info['username']} ({info['status']})" for info in players)}
 
 Status: {"Spectating" if self.spectator else "Participating"}
 """
             
-            self.battle_display.insert(1.0, field_text)
-            self.battle_display.config(state='disabled')
+            self._show_text(self.battle_display, field_text)
             
             # Update move buttons based on phase
             if not self.spectator and hasattr(self, 'move_buttons'):
@@ -692,21 +856,53 @@ Status: {"Spectating" if self.spectator else "Participating"}
                         btn.config(state='disabled')
         else:
             self.add_to_log("Failed to get battle state")
+        
+        return battle_state
     
-    def update_loop(self):
-        """Background update loop."""
-        while self.update_thread_running:
-            try:
-                self.update_display()
-                time.sleep(2)  # Update every 2 seconds
-                
-            except Exception as e:
-                print(f"Battle update error: {e}")
-                time.sleep(5)
+    def _show_text(self, widget: tk.Text, text: str):
+        """Replace a read-only Text widget's contents, skipping unchanged text."""
+        if self._shown_text.get(widget) == text:
+            return
+        widget.config(state='normal')
+        widget.replace(1.0, tk.END, text)
+        widget.config(state='disabled')
+        self._shown_text[widget] = text
+    
+    def _tick(self):
+        """Refresh the display and schedule the next refresh."""
+        try:
+            self._poll_delay = self._next_poll_delay(self.update_display())
+        except Exception as e:
+            print(f"Battle update error: {e}")
+            self._poll_delay = self.IDLE_POLL_MS
+        self._after_id = self.window.after(self._poll_delay, self._tick)
+    
+    def _next_poll_delay(self, battle_state: Optional[Dict[str, Any]]) -> int:
+        """Pick the next refresh delay from the battle phase and move timer."""
+        if not battle_state or battle_state['phase'] in self.IDLE_PHASES:
+            return self.IDLE_POLL_MS
+        
+        timer = battle_state['timer']
+        if battle_state['phase'] == 'move_selection' and timer['enabled']:
+            # Wake when the shown whole-second countdown next changes
+            until_next_second = int(timer['remaining'] % 1 * 1000)
+            return max(50, until_next_second or 1000)
+        
+        return self.ACTIVE_POLL_MS
+    
+    def _on_destroy(self, event):
+        """Stop refreshing once the battle window is gone."""
+        # <Destroy> on a Toplevel also fires for each of its children
+        if event.widget is not self.window:
+            return
+        
+        for after_id in (self._after_id, self._append_flush_id):
+            if after_id:
+                self.window.after_cancel(after_id)
+        self._after_id = self._append_flush_id = None
     
     def on_close(self):
         """Handle window close."""
-        self.update_thread_running = False
         self.window.destroy()
 
 # Integration with main GUI
@@ -716,8 +912,7 @@ def add_multiplayer_menu(parent_menu, main_window):
     parent_menu.add_cascade(label="Multiplayer", menu=multiplayer_menu)
     
     def open_multiplayer_lobby():
-        battle_manager = OnlineBattleManager()
-        MultiplayerLobbyGUI(main_window, battle_manager)
+        MultiplayerLobbyGUI.open(main_window)
     
     multiplayer_menu.add_command(label="Open Lobby", command=open_multiplayer_lobby)
     multiplayer_menu.add_separator()
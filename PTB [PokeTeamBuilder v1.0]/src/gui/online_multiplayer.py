@@ -4,12 +4,16 @@ Mock implementation for development purposes.
 """
 
 from enum import Enum
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 from dataclasses import dataclass
+from datetime import datetime
+import logging
 import uuid
 import threading
 import time
 
+logger = logging.getLogger(__name__)
+
 class BattleMode(Enum):
     """Battle modes available."""
     SINGLES = "singles"
@@ -59,6 +63,8 @@ class OnlineBattleManager:
         self.active_battles: Dict[str, Any] = {}
         self.players: Dict[str, BattlePlayer] = {}
         self.matchmaking_queue: List[str] = []
+        self._battle_summaries: Dict[str, Dict] = {}  # battle id -> get_battle_list entry
+        self._callbacks: Dict[str, List[Callable]] = {}
         
     def create_battle(self, creator_id: str, mode: BattleMode, format: BattleFormat) -> str:
         """Create a new battle."""
@@ -74,6 +80,18 @@ class OnlineBattleManager:
             'created_at': time.time()
         }
         self.active_battles[battle_id] = battle_data
+        # Same keys as the full manager's get_battle_list in src/features,
+        # plus the 'id' key this manager has always returned
+        self._battle_summaries[battle_id] = {
+            'id': battle_id,
+            'battle_id': battle_id,
+            'mode': getattr(mode, 'value', mode),
+            'format': getattr(format, 'value', format),
+            'players': 0,
+            'phase': BattlePhase.LOBBY.value,
+            'created_at': datetime.fromtimestamp(battle_data['created_at']).isoformat()
+        }
+        self._trigger_callbacks('battles_changed')
         return battle_id
     
     def join_battle(self, battle_id: str, player_id: str) -> bool:
@@ -89,20 +107,37 @@ class OnlineBattleManager:
             'status': PlayerStatus.ONLINE,
             'ready': False
         }
+        self._battle_summaries[battle_id]['players'] = len(battle['players'])
+        self._trigger_callbacks('battles_changed')
+        return True
+    
+    def set_battle_phase(self, battle_id: str, phase: BattlePhase) -> bool:
+        """Move a battle to a new phase; finished battles are removed."""
+        if battle_id not in self.active_battles:
+            return False
+        
+        if phase == BattlePhase.FINISHED:
+            return self.remove_battle(battle_id)
+        
+        self.active_battles[battle_id]['phase'] = phase
+        self._battle_summaries[battle_id]['phase'] = phase.value
+        self._trigger_callbacks('battles_changed')
+        return True
+    
+    def remove_battle(self, battle_id: str) -> bool:
+        """Remove a battle from the active battles."""
+        if self.active_battles.pop(battle_id, None) is None:
+            return False
+        
+        del self._battle_summaries[battle_id]
+        self._trigger_callbacks('battles_changed')
         return True
     
     def get_battle_list(self) -> List[Dict]:
         """Get list of active battles."""
-        return [
-            {
-                'id': bid,
-                'mode': battle['mode'].value if hasattr(battle['mode'], 'value') else battle['mode'],
-                'format': battle['format'].value if hasattr(battle['format'], 'value') else battle['format'],
-                'players': len(battle['players']),
-                'phase': battle['phase'].value if hasattr(battle['phase'], 'value') else battle['phase']
-            }
-            for bid, battle in self.active_battles.items()
-        ]
+        # Summaries are kept up to date by create_battle, join_battle,
+        # set_battle_phase and remove_battle; callers get copies
+        return [dict(summary) for summary in self._battle_summaries.values()]
     
     def send_battle_message(self, battle_id: str, message: BattleMessage) -> bool:
         """Send a message in battle."""
@@ -114,4 +149,16 @@ class OnlineBattleManager:
     def update_player_status(self, player_id: str, status: PlayerStatus):
         """Update player status."""
         if player_id in self.players:
-            self.players[player_id].status = status
\ No newline at end of file
+            self.players[player_id].status = status
+    
+    def _trigger_callbacks(self, event_type: str, *args):
+        """Trigger registered callbacks."""
+        for callback in self._callbacks.get(event_type, ()):
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Callback error: {e}")
+    
+    def register_callback(self, event_type: str, callback: Callable):
+        """Register callback for events ('battles_changed')."""
+        self._callbacks.setdefault(event_type, []).append(callback)
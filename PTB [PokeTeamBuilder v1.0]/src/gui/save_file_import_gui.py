@@ -465,13 +465,9 @@ class SaveFileImportFrame(tk.Frame):
     
     def refresh_pokemon_list(self):
         """Refresh the Pokemon list display."""
-        # Clear existing items
-        for item in self.pokemon_tree.get_children():
-            self.pokemon_tree.delete(item)
-        
-        # Add imported Pokemon
-        for pokemon in self.imported_pokemon:
-            values = (
+        # Build every row before touching the tree
+        rows = [
+            (
                 pokemon.species_name,
                 pokemon.nickname if pokemon.nickname != pokemon.species_name else "",
                 pokemon.level,
@@ -484,7 +480,14 @@ class SaveFileImportFrame(tk.Frame):
                 pokemon.sp_defense,
                 pokemon.speed
             )
-            self.pokemon_tree.insert('', 'end', values=values)
+            for pokemon in self.imported_pokemon
+        ]
+        
+        # Clear existing items in one call, then add the imported Pokemon
+        self.pokemon_tree.delete(*self.pokemon_tree.get_children())
+        insert = self.pokemon_tree.insert
+        for values in rows:
+            insert('', 'end', values=values)
     
     def on_pokemon_select(self, event):
         """Handle Pokemon selection in the tree."""
@@ -590,9 +593,8 @@ class SaveFileImportFrame(tk.Frame):
     
     def refresh_teams_list(self):
         """Refresh the teams list display."""
-        # Clear existing items
-        for item in self.teams_tree.get_children():
-            self.teams_tree.delete(item)
+        # Clear existing items in one call
+        self.teams_tree.delete(*self.teams_tree.get_children())
         
         # Add imported teams
         for team in self.imported_teams:
@@ -644,8 +646,7 @@ class SaveFileImportFrame(tk.Frame):
     def clear_history(self):
         """Clear import history."""
         if messagebox.askyesno("Clear History", "Are you sure you want to clear the import history?"):
-            for item in self.history_tree.get_children():
-                self.history_tree.delete(item)
+            self.history_tree.delete(*self.history_tree.get_children())
             messagebox.showinfo("History Cleared", "Import history cleared!")
     
     def export_history(self):
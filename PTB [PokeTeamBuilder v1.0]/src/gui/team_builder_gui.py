@@ -8,10 +8,12 @@ from tkinter import ttk, messagebox
 import sys
 import os
 
-# Add the src directory to the path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Add the project root to the path for imports when run outside run_gui.py
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
 
-from src.gui.theme_manager import ThemeManager
+from src.gui.theme_manager import ThemeManager, center_window
 from src.teambuilder.team import PokemonTeam, TeamFormat, TeamEra
 from src.teambuilder.analyzer import TeamAnalyzer
 from src.teambuilder.validator import TeamValidator
@@ -633,15 +635,9 @@ class TeamBuilderFrame(tk.Frame):
             # Create import dialog
             import_window = tk.Toplevel(self)
             import_window.title("Import Team")
-            import_window.geometry("600x400")
             import_window.transient(self)
             import_window.grab_set()
-            
-            # Center the window
-            import_window.update_idletasks()
-            x = (import_window.winfo_screenwidth() // 2) - (600 // 2)
-            y = (import_window.winfo_screenheight() // 2) - (400 // 2)
-            import_window.geometry(f"600x400+{x}+{y}")
+            center_window(import_window, 600, 400)
             
             # Import format selection
             format_frame = self.theme_manager.create_styled_frame(import_window)
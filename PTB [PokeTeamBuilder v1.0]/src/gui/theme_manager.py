@@ -3,7 +3,7 @@ Theme management system for Pokemon Team Builder GUI.
 Provides multiple color schemes and styling options.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from enum import Enum
 import tkinter as tk
 from tkinter import ttk
@@ -19,12 +19,22 @@ class ThemeType(Enum):
     RETRO = "retro"
 
 
+def center_window(window: tk.Misc, width: int, height: int):
+    """Size a window and center it on screen without forcing a layout pass."""
+    x = (window.winfo_screenwidth() - width) // 2
+    y = (window.winfo_screenheight() - height) // 2
+    window.geometry(f"{width}x{height}+{x}+{y}")
+
+
 class ThemeManager:
     """Manages GUI themes and styling."""
     
     def __init__(self):
         self.current_theme = ThemeType.POKEMON
         self.themes = self._initialize_themes()
+        
+        # Per-theme widget options, built on first use
+        self._style_cache: Dict[ThemeType, Dict[str, Dict[str, Any]]] = {}
     
     def _initialize_themes(self) -> Dict[ThemeType, Dict[str, Any]]:
         """Initialize all available themes."""
@@ -157,81 +167,125 @@ class ThemeManager:
         """Set the current theme."""
         self.current_theme = theme_type
     
+    def _widget_styles(self, theme_type: ThemeType) -> Dict[str, Dict[str, Any]]:
+        """Get configure() options per widget category, built once per theme."""
+        styles = self._style_cache.get(theme_type)
+        if styles is not None:
+            return styles
+        
+        theme = self.get_theme(theme_type)
+        styles = {
+            # Tk root only supports bg, not fg
+            'window': {'bg': theme['bg']},
+            'frame': {
+                'bg': theme['bg'],
+                'highlightbackground': theme['border'],
+                'highlightcolor': theme['accent']
+            },
+            'label': {
+                'bg': theme['bg'],
+                'fg': theme['fg']
+            },
+            'error_label': {
+                'bg': theme['bg'],
+                'fg': theme['error']
+            },
+            'button': {
+                'bg': theme['accent'],
+                'fg': 'white',
+                'activebackground': theme['highlight'],
+                'activeforeground': 'white',
+                'relief': 'flat',
+                'borderwidth': 0,
+                'padx': 10,
+                'pady': 5
+            },
+            'entry': {
+                'bg': theme['secondary'],
+                'fg': theme['fg'],
+                'insertbackground': theme['fg'],
+                'relief': 'flat',
+                'borderwidth': 1,
+                'highlightthickness': 1,
+                'highlightbackground': theme['border'],
+                'highlightcolor': theme['accent']
+            },
+            'text': {
+                'bg': theme['secondary'],
+                'fg': theme['fg'],
+                'insertbackground': theme['fg'],
+                'relief': 'flat',
+                'borderwidth': 1,
+                'highlightthickness': 1,
+                'highlightbackground': theme['border'],
+                'highlightcolor': theme['accent']
+            },
+            'treeview': {
+                'background': theme['secondary'],
+                'foreground': theme['fg'],
+                'fieldbackground': theme['secondary'],
+                'borderwidth': 0
+            },
+            'treeview_heading': {
+                'background': theme['accent'],
+                'foreground': 'white',
+                'relief': 'flat'
+            }
+        }
+        self._style_cache[theme_type] = styles
+        return styles
+    
+    @staticmethod
+    def _widget_category(widget: tk.Widget) -> Optional[str]:
+        """Get the style category used to theme a widget, if any."""
+        # Widgets created with a style variant keep it across theme changes
+        category = getattr(widget, '_theme_category', None)
+        if category is not None:
+            return category
+        if isinstance(widget, (tk.Tk, tk.Toplevel)):
+            return 'window'
+        if isinstance(widget, (tk.Frame, tk.LabelFrame)):
+            return 'frame'
+        if isinstance(widget, tk.Label):
+            return 'label'
+        if isinstance(widget, tk.Button):
+            return 'button'
+        if isinstance(widget, tk.Entry):
+            return 'entry'
+        if isinstance(widget, tk.Text):
+            return 'text'
+        if isinstance(widget, ttk.Treeview):
+            return 'treeview'
+        return None
+    
     def apply_theme(self, widget: tk.Widget, theme_type: ThemeType = None):
         """Apply a theme to a widget and its children."""
-        theme = self.get_theme(theme_type)
+        if theme_type is None:
+            theme_type = self.current_theme
         
-        try:
-            if isinstance(widget, tk.Tk) or isinstance(widget, tk.Toplevel):
-                # Tk root only supports bg, not fg
-                widget.configure(bg=theme['bg'])
-            elif isinstance(widget, tk.Frame) or isinstance(widget, tk.LabelFrame):
-                widget.configure(
-                    bg=theme['bg'],
-                    highlightbackground=theme['border'],
-                    highlightcolor=theme['accent']
-                )
-            elif isinstance(widget, tk.Label):
-                widget.configure(
-                    bg=theme['bg'],
-                    fg=theme['fg']
-                )
-            elif isinstance(widget, tk.Button):
-                widget.configure(
-                    bg=theme['accent'],
-                    fg='white',
-                    activebackground=theme['highlight'],
-                    activeforeground='white',
-                    relief='flat',
-                    borderwidth=0,
-                    padx=10,
-                    pady=5
-                )
-            elif isinstance(widget, tk.Entry):
-                widget.configure(
-                    bg=theme['secondary'],
-                    fg=theme['fg'],
-                    insertbackground=theme['fg'],
-                    relief='flat',
-                    borderwidth=1,
-                    highlightthickness=1,
-                    highlightbackground=theme['border'],
-                    highlightcolor=theme['accent']
-                )
-            elif isinstance(widget, tk.Text):
-                widget.configure(
-                    bg=theme['secondary'],
-                    fg=theme['fg'],
-                    insertbackground=theme['fg'],
-                    relief='flat',
-                    borderwidth=1,
-                    highlightthickness=1,
-                    highlightbackground=theme['border'],
-                    highlightcolor=theme['accent']
-                )
-            elif isinstance(widget, ttk.Treeview):
-                style = ttk.Style()
-                style.theme_use('clam')
-                style.configure(
-                    'Treeview',
-                    background=theme['secondary'],
-                    foreground=theme['fg'],
-                    fieldbackground=theme['secondary'],
-                    borderwidth=0
-                )
-                style.configure(
-                    'Treeview.Heading',
-                    background=theme['accent'],
-                    foreground='white',
-                    relief='flat'
-                )
-        except tk.TclError as e:
-            # Some widgets don't support all options - silently skip
-            pass
+        self._apply_styles(widget, theme_type, self._widget_styles(theme_type))
+    
+    def _apply_styles(self, widget: tk.Widget, theme_type: ThemeType, styles: Dict[str, Dict[str, Any]]):
+        """Configure a widget tree, skipping widgets that already show the theme."""
+        # The last theme applied is stored on the widget itself
+        if getattr(widget, '_applied_theme', None) is not theme_type:
+            try:
+                category = self._widget_category(widget)
+                if category == 'treeview':
+                    style = ttk.Style()
+                    style.theme_use('clam')
+                    style.configure('Treeview', **styles['treeview'])
+                    style.configure('Treeview.Heading', **styles['treeview_heading'])
+                elif category is not None:
+                    widget.configure(**styles[category])
+                widget._applied_theme = theme_type
+            except tk.TclError as e:
+                # Some widgets don't support all options - silently skip
+                pass
         
         # Apply theme to children
         for child in widget.winfo_children():
-            self.apply_theme(child, theme_type)
+            self._apply_styles(child, theme_type, styles)
     
     def get_type_color(self, pokemon_type: str) -> str:
         """Get the color for a specific Pokemon type."""
@@ -336,18 +390,27 @@ class ThemeManager:
         parent: tk.Widget,
         text: str,
         theme_type: ThemeType = None,
+        style: str = "normal",
         **kwargs
     ) -> tk.Label:
         """Create a styled label with the current theme."""
         theme = self.get_theme(theme_type)
         
+        # Label style variants
+        if style == "error":
+            fg_color = theme['error']
+        else:
+            fg_color = theme['fg']
+        
         label = tk.Label(
             parent,
             text=text,
             bg=theme['bg'],
-            fg=theme['fg'],
+            fg=fg_color,
             **kwargs
         )
+        if style == "error":
+            label._theme_category = 'error_label'
         
         return label
     
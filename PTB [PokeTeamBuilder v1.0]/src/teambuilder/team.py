@@ -3,7 +3,7 @@ Pokemon team management system.
 Handles team composition, validation, and management across different game eras.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 import json
@@ -382,6 +382,46 @@ class PokemonTeam:
         
         return True
     
+    def extend(self, pokemon_list: Iterable[Pokemon]) -> bool:
+        """
+        Add several Pokemon to the team's empty slots in one pass.
+        
+        All Pokemon are validated before any slot is filled, so the team is
+        left unchanged if one of them is rejected.
+        
+        Args:
+            pokemon_list: Pokemon to add, in slot order
+            
+        Returns:
+            True if all Pokemon were added successfully
+        """
+        pokemon_list = list(pokemon_list)
+        
+        for pokemon in pokemon_list:
+            if not isinstance(pokemon, (Pokemon, ShadowPokemon)):
+                raise ValueError("Pokemon must be a valid Pokemon or ShadowPokemon instance")
+            if not self._is_pokemon_compatible(pokemon):
+                raise ValueError(f"Pokemon {pokemon.name} is not compatible with {self.era.value} era")
+        
+        empty_slots = [slot for slot in self.slots if slot.is_empty()]
+        if len(pokemon_list) > len(empty_slots):
+            raise ValueError("Team is full")
+        
+        for slot, pokemon in zip(empty_slots, pokemon_list):
+            slot.pokemon = pokemon
+            slot.nickname = None
+            slot.item = None
+            slot.is_active = True
+        
+        self.modified_at = datetime.now()
+        
+        # Log the addition
+        from ..utils.logging_config import get_logger
+        logger = get_logger(f'ptb.team.{self.name.lower().replace(" ", "_")}')
+        logger.info(f"Added {len(pokemon_list)} Pokemon to team {self.name}")
+        
+        return True
+    
     def remove_pokemon(self, position: int) -> bool:
         """
         Remove a Pokemon from the team.
@@ -0,0 +1,34 @@
+"""
+Tests for the lobby's non-GUI update plumbing: update deduplication and
+battle manager callbacks.
+"""
+
+from src.gui.multiplayer_gui import _QueueDiffer
+from src.gui.online_multiplayer import (
+    OnlineBattleManager, BattleMode, BattleFormat
+)
+
+
+def drain(differ: _QueueDiffer) -> list:
+    items = []
+    while not differ.queue.empty():
+        items.append(differ.queue.get_nowait())
+    return items
+
+
+def test_queue_differ_skips_unchanged_payloads():
+    differ = _QueueDiffer()
+    assert differ.put('battles', [('a',)]) is True
+    assert differ.put('battles', [('a',)]) is False
+    differ.put('profile', "text")
+    differ.put('battles', [('b',)])
+    
+    assert drain(differ) == [('battles', [('a',)]), ('profile', "text"), ('battles', [('b',)])]
+
+
+def test_callback_errors_do_not_break_the_manager():
+    manager = OnlineBattleManager()
+    manager.register_callback('battles_changed', lambda: 1 / 0)
+    
+    battle_id = manager.create_battle("host", BattleMode.SINGLES, BattleFormat.CASUAL)
+    assert manager.join_battle(battle_id, "player") is True
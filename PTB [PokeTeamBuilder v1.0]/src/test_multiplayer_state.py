@@ -0,0 +1,35 @@
+"""
+Tests for the battle list summaries kept by the battle manager.
+"""
+
+from datetime import datetime
+
+from src.gui.online_multiplayer import (
+    OnlineBattleManager, BattleMode, BattleFormat, BattlePhase
+)
+
+
+def test_battle_list_summaries_track_manager_changes():
+    manager = OnlineBattleManager()
+    events = []
+    manager.register_callback('battles_changed', lambda: events.append(manager.get_battle_list()))
+    
+    battle_id = manager.create_battle("host", BattleMode.SINGLES, BattleFormat.CASUAL)
+    manager.join_battle(battle_id, "player")
+    manager.set_battle_phase(battle_id, BattlePhase.BATTLING)
+    
+    (summary,) = manager.get_battle_list()
+    assert summary['id'] == summary['battle_id'] == battle_id
+    assert summary['mode'] == "singles"
+    assert summary['format'] == "casual"
+    assert summary['players'] == 1
+    assert summary['phase'] == "battling"
+    datetime.fromisoformat(summary['created_at'])
+    assert len(events) == 3
+    # Earlier results are snapshots, not live views of the summaries
+    assert events[0][0]['players'] == 0
+    assert events[0][0]['phase'] == "lobby"
+    
+    manager.set_battle_phase(battle_id, BattlePhase.FINISHED)
+    assert manager.get_battle_list() == []
+    assert battle_id not in manager.active_battles
@@ -0,0 +1,83 @@
+"""
+Tests for the trigger-maintained system_stats counters in the social database.
+"""
+
+import pytest
+
+from src.features.social_community_hub import SocialDatabase
+
+
+# Counter name -> query computing the same value from scratch
+EXPECTED_QUERIES = {
+    'total_users': "SELECT COUNT(*) FROM users",
+    'verified_users': "SELECT COUNT(*) FROM users WHERE email_verified = 1",
+    'online_users': "SELECT COUNT(*) FROM users WHERE status = 'online'",
+    'total_friendships': "SELECT COUNT(*) FROM friendships",
+    'active_friendships': "SELECT COUNT(*) FROM friendships WHERE status = 'accepted'",
+}
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = SocialDatabase(str(tmp_path / "social.db"))
+    yield db
+    db.close()
+
+
+def assert_counters_match(db: SocialDatabase):
+    counters = db.get_stat_counters()
+    for name, query in EXPECTED_QUERIES.items():
+        assert counters[name] == db.connection.execute(query).fetchone()[0], name
+
+
+def add_user(db: SocialDatabase, user_id: str, **columns):
+    values = {'user_id': user_id, 'username': user_id, 'email': f"{user_id}@example.com",
+              'display_name': user_id, **columns}
+    names = ', '.join(values)
+    marks = ', '.join('?' for _ in values)
+    db.connection.execute(f"INSERT INTO users ({names}) VALUES ({marks})", tuple(values.values()))
+
+
+def test_get_stat_counters_has_every_counter(database):
+    assert set(database.get_stat_counters()) == set(SocialDatabase.STAT_COUNTERS)
+
+
+def test_counters_match_fresh_database(database):
+    assert_counters_match(database)
+
+
+def test_user_counters_follow_inserts_updates_and_deletes(database):
+    add_user(database, "u1")
+    add_user(database, "u2", email_verified=1, status='online')
+    assert_counters_match(database)
+    
+    database.connection.execute("UPDATE users SET status = 'online', email_verified = 1 WHERE user_id = 'u1'")
+    assert_counters_match(database)
+    
+    database.connection.execute("UPDATE users SET status = 'offline' WHERE user_id = 'u2'")
+    assert_counters_match(database)
+    
+    database.connection.execute("DELETE FROM users WHERE user_id IN ('u1', 'u2')")
+    assert_counters_match(database)
+
+
+def test_friendship_counters_follow_status_changes(database):
+    add_user(database, "a")
+    add_user(database, "b")
+    database.connection.execute(
+        "INSERT INTO friendships (friendship_id, requester_id, recipient_id) VALUES ('f1', 'a', 'b')"
+    )
+    assert_counters_match(database)
+    
+    database.connection.execute("UPDATE friendships SET status = 'accepted' WHERE friendship_id = 'f1'")
+    assert database.get_stat_counters()['active_friendships'] == 1
+    assert_counters_match(database)
+    
+    database.connection.execute("DELETE FROM friendships WHERE friendship_id = 'f1'")
+    assert_counters_match(database)
+
+
+def test_close_is_idempotent(database):
+    database.close()
+    database.close()
+    assert database.connection is None
@@ -0,0 +1,38 @@
+"""
+Tests for adding several Pokemon to a team at once.
+"""
+
+import pytest
+
+from src.core.pokemon import Pokemon
+from src.teambuilder.team import PokemonTeam
+
+
+def make_pokemon(name: str = "Bulbasaur", species_id: int = 1) -> Pokemon:
+    return Pokemon(name=name, species_id=species_id, level=50)
+
+
+def test_extend_fills_empty_slots_in_order():
+    team = PokemonTeam(name="Test Team")
+    first, second = make_pokemon("Bulbasaur", 1), make_pokemon("Charmander", 4)
+    
+    assert team.extend([first, second]) is True
+    assert team.get_team_size() == 2
+    assert [slot.pokemon for slot in team.slots[:2]] == [first, second]
+
+
+def test_extend_rejects_non_pokemon_without_changing_team():
+    team = PokemonTeam(name="Test Team")
+    
+    with pytest.raises(ValueError):
+        team.extend([make_pokemon(), "not a pokemon"])
+    assert team.get_team_size() == 0
+
+
+def test_extend_rejects_overflow_without_changing_team():
+    team = PokemonTeam(name="Test Team", max_size=6)
+    team.extend([make_pokemon() for _ in range(4)])
+    
+    with pytest.raises(ValueError, match="full"):
+        team.extend([make_pokemon() for _ in range(3)])
+    assert team.get_team_size() == 4